@@ -0,0 +1,87 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from typing import Optional
+import logging
+import secrets
+
+from app.core.config import settings
+from app.core.database import get_redis
+from app.services import jargon_service
+from app.services.negative_cache import negative_cache
+
+logger = logging.getLogger(__name__)
+
+
+async def require_admin(x_admin_key: Optional[str] = Header(None)):
+    """
+    X-Admin-Key 헤더를 ADMIN_API_KEY와 비교합니다.
+    ADMIN_API_KEY가 설정되지 않았으면 관리자 API를 모두 거부합니다.
+    """
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 API가 비활성화되어 있습니다."
+        )
+    if not (x_admin_key and secrets.compare_digest(x_admin_key, settings.ADMIN_API_KEY)):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다."
+        )
+
+
+router = APIRouter(prefix="/admin", dependencies=[Depends(require_admin)])
+
+@router.get("/negative-cache")
+async def get_negative_cache(
+    limit: int = Query(100, ge=1, le=1000),
+    redis_client = Depends(get_redis)
+):
+    """
+    정보 없음으로 기록된 단어 목록을 최근 기록 순으로 반환합니다.
+    """
+    try:
+        return await negative_cache.entries(redis_client, limit)
+
+    except Exception as e:
+        logger.error(f"정보 없음 캐시 조회 중 오류 발생: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="정보 없음 캐시 조회 중 오류가 발생했습니다."
+        )
+
+@router.delete("/negative-cache")
+async def clear_negative_cache(redis_client = Depends(get_redis)):
+    """
+    정보 없음 캐시를 모두 비웁니다.
+    """
+    try:
+        count = await jargon_service.clear_unknown(redis_client)
+        logger.info(f"정보 없음 캐시 초기화: {count}개 삭제")
+        return {"message": "정보 없음 캐시를 비웠습니다", "deleted": count}
+
+    except Exception as e:
+        logger.error(f"정보 없음 캐시 초기화 중 오류 발생: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="정보 없음 캐시 초기화 중 오류가 발생했습니다."
+        )
+
+@router.delete("/negative-cache/{word}")
+async def delete_negative_cache_entry(word: str, redis_client = Depends(get_redis)):
+    """
+    단어를 정보 없음 캐시에서 삭제해 다음 조회 때 다시 분석하도록 합니다.
+    """
+    try:
+        removed = await jargon_service.forget_unknown(redis_client, word)
+    except Exception as e:
+        logger.error(f"정보 없음 캐시 삭제 중 오류 발생: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="정보 없음 캐시 삭제 중 오류가 발생했습니다."
+        )
+
+    if not removed:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"'{word}'는 정보 없음 캐시에 없습니다."
+        )
+    return {"message": f"'{word}'를 정보 없음 캐시에서 삭제했습니다"}
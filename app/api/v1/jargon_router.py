@@ -1,44 +1,195 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import RedirectResponse, StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+import asyncio
+import gzip
+import json
 import logging
 
-from app.core.database import get_db, get_redis
+from app.core import rate_limit
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, get_db, get_read_db, get_redis
 from app.models.jargon import Jargon
 from app.schemas.jargon_schema import (
+    JargonAutocompleteResponse,
     JargonCreate, 
     JargonResponse, 
     JargonUpdate, 
     JargonSearchRequest,
-    JargonAnalysisRequest
+    JargonAnalysisRequest,
+    JargonBatchRequest,
+    JargonBatchResponse,
+    JargonJobRequest,
+    JargonJobResponse,
+    JargonMatch,
+    JargonScanRequest,
+    JargonScanResponse,
+    JargonSuggestion
 )
-from app.services.ai_service import AIService
+from app.services.ai_service import ai_service
+from app.services.autocomplete import MAX_SUGGESTIONS, autocomplete
+from app.services.llm_client import LLMUnavailableError, TokenBudgetExceededError
+from app.services.prompt_cache import prompt_cache
+from app.services import jargon_service
+from app.services.jargon_scanner import jargon_scanner
+from app.services.job_service import analysis_jobs
+from app.services.snapshot_service import accepts_gzip, dictionary_snapshot, etag_matches
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+@router.get("/jargon/stats/cache")
+async def get_cache_stats():
+    """
+    신조어 조회 계층별 캐시 hit/miss 통계를 반환합니다.
+    """
+    return jargon_service.lookup_stats.snapshot()
+
+@router.get("/jargon/snapshot")
+async def get_snapshot(
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+    redis_client = Depends(get_redis)
+):
+    """
+    클라이언트 캐시용 전체 사전 스냅샷(JSON)을 반환합니다.
+    Accept-Encoding이 gzip을 허용하면 압축된 본문을 그대로 보냅니다.
+    ETag가 같으면 304를 반환합니다.
+    """
+    try:
+        version, body = await dictionary_snapshot.get(redis_client)
+        etag = dictionary_snapshot.etag(version)
+        headers = {"ETag": etag, "X-Dictionary-Version": str(version), "Vary": "Accept-Encoding"}
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        
+        if accepts_gzip(accept_encoding):
+            headers["Content-Encoding"] = "gzip"
+        else:
+            body = await asyncio.to_thread(gzip.decompress, body)
+        return Response(content=body, media_type="application/json", headers=headers)
+        
+    except Exception as e:
+        logger.error(f"사전 스냅샷 조회 중 오류 발생: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="사전 스냅샷 조회 중 오류가 발생했습니다."
+        )
+
+@router.get("/jargon/snapshot/delta")
+async def get_snapshot_delta(
+    since: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+    redis_client = Depends(get_redis)
+):
+    """
+    since 버전 이후 변경된 사전 항목만 반환합니다.
+    변경 이력이 since까지 남아 있지 않으면 미리 만들어 둔 전체 스냅샷으로 보냅니다 (303).
+    """
+    try:
+        version = await dictionary_snapshot.current_version(redis_client)
+        etag = dictionary_snapshot.etag(version, since)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        
+        delta = await dictionary_snapshot.delta(redis_client, db, since)
+        if delta is None:
+            return RedirectResponse("/api/v1/jargon/snapshot", status_code=status.HTTP_303_SEE_OTHER)
+        response.headers["ETag"] = dictionary_snapshot.etag(delta["version"], since)
+        return delta
+        
+    except Exception as e:
+        logger.error(f"사전 변경분 조회 중 오류 발생: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="사전 변경분 조회 중 오류가 발생했습니다."
+        )
+
+@router.get("/jargon/export")
+async def export_jargons():
+    """
+    저장된 전체 신조어를 NDJSON 스트림으로 내보냅니다.
+    """
+    return StreamingResponse(
+        jargon_service.export_ndjson(),
+        media_type="application/x-ndjson"
+    )
+
+@router.get("/jargon/search", response_model=List[JargonResponse])
+async def search_jargons(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    단어 또는 설명에 검색어가 포함된 신조어를 조회합니다.
+    단어가 검색어로 시작하는 항목을 먼저, 그 안에서는 조회수가 높은 순으로 반환합니다.
+    """
+    try:
+        return await jargon_service.search_jargons(db, q, limit)
+
+    except Exception as e:
+        logger.error(f"신조어 검색 중 오류 발생: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="검색 중 오류가 발생했습니다."
+        )
+
+@router.get("/jargon/autocomplete", response_model=JargonAutocompleteResponse)
+async def autocomplete_jargons(
+    prefix: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=MAX_SUGGESTIONS),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    입력 중인 접두어로 시작하는 신조어를 조회수가 높은 순으로 반환합니다.
+    메모리 내 정렬 인덱스에서 조회하며, 조합 중인 한글(예: '킹ㅂ')도 일치시킵니다.
+    """
+    try:
+        suggestions = await autocomplete.suggest(prefix, limit, db)
+        return JargonAutocompleteResponse(
+            prefix=prefix,
+            suggestions=[
+                JargonSuggestion(word=word, search_count=count) for word, count in suggestions
+            ]
+        )
+
+    except Exception as e:
+        logger.error(f"자동완성 조회 중 오류 발생: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="자동완성 조회 중 오류가 발생했습니다."
+        )
+
 @router.get("/jargon/{word}")
-async def get_jargon(word: str):
+async def get_jargon(
+    word: str,
+    db: AsyncSession = Depends(get_read_db),
+    redis_client = Depends(get_redis)
+):
     """
     신조어 정보를 조회합니다. 
-    Redis 캐시 → PostgreSQL DB → GPT API 순서로 조회합니다.
+    프로세스 내 캐시 → Redis 캐시 → PostgreSQL DB → GPT API 순서로 조회합니다.
     """
     try:
-        # 간단한 테스트 데이터 반환
-        test_data = {
-            "word": word,
-            "explanation": f"'{word}'에 대한 설명입니다. 이는 테스트용 데이터입니다.",
-            "source": "테스트 데이터",
-            "search_count": 1,
-            "is_user_modified": False,
-            "modified_by": None,
-            "created_at": "2024-01-01T00:00:00",
-            "updated_at": None
-        }
-        
-        logger.info(f"테스트 데이터로 '{word}' 반환")
-        return test_data
+        entry = await jargon_service.get_interpretation(word, db, redis_client)
+        return Response(content=entry.body, media_type="application/json")
         
+    except TokenBudgetExceededError:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="오늘의 LLM 사용량을 모두 사용했습니다."
+        )
+    except LLMUnavailableError as e:
+        logger.warning(f"LLM을 사용할 수 없어 '{word}' 조회 실패: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="일시적으로 신조어를 분석할 수 없습니다. 잠시 후 다시 시도해주세요."
+        )
     except Exception as e:
         logger.error(f"신조어 조회 중 오류 발생: {e}")
         raise HTTPException(
@@ -49,36 +200,29 @@ async def get_jargon(word: str):
 @router.post("/jargon/analyze")
 async def analyze_jargons(
     request: JargonAnalysisRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     redis_client = Depends(get_redis)
 ):
     """
     여러 신조어를 한 번에 분석합니다.
     """
     try:
-        ai_service = AIService()
-        analysis_results = await ai_service.analyze_jargon(
-            request.words, 
-            request.context
-        )
-        
-        # 분석 결과를 DB에 저장
-        saved_jargons = []
-        for result in analysis_results:
-            jargon = Jargon(
-                word=result["word"],
-                explanation=result["explanation"],
-                source=result.get("source", "알 수 없음")
+        try:
+            # 분석 결과는 DB/캐시에 저장됩니다 (컨텍스트가 있으면 프롬프트 캐시에만 저장)
+            analysis_results = await jargon_service.analyze_words(
+                request.words, 
+                request.context,
+                redis_client
             )
-            db.add(jargon)
-            saved_jargons.append(jargon)
-        
-        db.commit()
-        
-        # Redis에 캐시 저장
-        for jargon in saved_jargons:
-            cache_key = f"jargon:{jargon.word}"
-            redis_client.setex(cache_key, 3600, "cached")
+        except LLMUnavailableError as e:
+            # LLM 장애 시 저장된 결과로 대체
+            logger.warning(f"LLM을 사용할 수 없어 저장된 결과를 반환합니다: {e}")
+            stored = await jargon_service.find_jargons(db, request.words)
+            return {
+                "message": "분석 서비스를 일시적으로 사용할 수 없어 저장된 결과를 반환합니다",
+                "results": stored,
+                "fallback": True
+            }
         
         logger.info(f"{len(request.words)}개 신조어 분석 완료")
         return {"message": "분석 완료", "results": analysis_results}
@@ -90,18 +234,180 @@ async def analyze_jargons(
             detail="분석 중 오류가 발생했습니다."
         )
 
+@router.post("/jargon/analyze/stream")
+async def analyze_jargons_stream(
+    request: JargonAnalysisRequest,
+    redis_client = Depends(get_redis)
+):
+    """
+    여러 신조어를 분석하면서 결과를 Server-Sent Events로 스트리밍합니다.
+    token 이벤트로 생성 중인 텍스트를, word 이벤트로 완성된 단어를 바로 전달하고,
+    모든 결과를 저장한 뒤 done 이벤트를 보냅니다.
+    """
+    return StreamingResponse(
+        _analysis_events(request, redis_client),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # nginx가 응답을 버퍼링하지 않도록 설정
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+async def _analysis_events(request: JargonAnalysisRequest, redis_client):
+    results = []
+    try:
+        # 같은 분석의 응답 원문이 캐시에 있으면 바로 반환
+        cache_key = prompt_cache.key(request.words, request.context)
+        completion = await prompt_cache.get(redis_client, cache_key)
+        if completion is not None:
+            results = ai_service.parse_completion(completion, request.words)
+            for result in results:
+                yield _sse("word", result)
+            yield _sse("done", {"results": results})
+            return
+        
+        async for kind, value in ai_service.stream_analysis(request.words, request.context):
+            if kind == "token":
+                yield _sse("token", {"text": value})
+            elif kind == "word":
+                results.append(value)
+                yield _sse("word", value)
+            else:
+                completion = value
+        
+        await prompt_cache.set(redis_client, cache_key, completion)
+        # 컨텍스트에 따라 달라진 답변은 단어별 캐시와 DB에 저장하지 않습니다.
+        if not request.context:
+            async with AsyncSessionLocal() as db:
+                await jargon_service.store_analysis(db, redis_client, results)
+        
+        logger.info(f"{len(request.words)}개 신조어 스트리밍 분석 완료")
+        yield _sse("done", {"results": results})
+        
+    except LLMUnavailableError as e:
+        logger.warning(f"LLM을 사용할 수 없어 스트리밍 분석 실패: {e}")
+        yield _sse("error", {"detail": "일시적으로 신조어를 분석할 수 없습니다. 잠시 후 다시 시도해주세요."})
+    except Exception as e:
+        logger.error(f"신조어 스트리밍 분석 중 오류 발생: {e}")
+        yield _sse("error", {"detail": "분석 중 오류가 발생했습니다."})
+
+@router.post("/jargon/analyze/jobs", status_code=status.HTTP_202_ACCEPTED)
+async def submit_analysis_job(
+    request: JargonJobRequest,
+    response: Response,
+    redis_client = Depends(get_redis)
+):
+    """
+    신조어 분석 작업을 큐에 등록하고 작업 ID를 바로 반환합니다.
+    결과는 GET /jargon/jobs/{job_id}로 조회합니다.
+    요청 수 제한은 청크 수만큼 차감합니다 (요청 1건 몫은 미들웨어가 이미 차감).
+    """
+    chunks = -(-len(request.words) // settings.JOB_CHUNK_SIZE)
+    await rate_limit.charge(redis_client, (chunks - 1) * settings.RATE_LIMIT_LLM_COST)
+    try:
+        job_id = await analysis_jobs.submit(redis_client, request.words, request.context)
+        response.headers["Location"] = f"/api/v1/jargon/jobs/{job_id}"
+        logger.info(f"분석 작업 {job_id} 등록: {len(request.words)}개 단어")
+        return {"job_id": job_id, "status": "queued"}
+        
+    except Exception as e:
+        logger.error(f"분석 작업 등록 중 오류 발생: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="분석 작업 등록 중 오류가 발생했습니다."
+        )
+
+@router.get("/jargon/jobs/{job_id}", response_model=JargonJobResponse)
+async def get_analysis_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=30),
+    redis_client = Depends(get_redis)
+):
+    """
+    분석 작업의 상태와 결과를 반환합니다.
+    wait을 지정하면 작업이 끝날 때까지 최대 wait초 동안 기다립니다 (long polling).
+    """
+    try:
+        job = await analysis_jobs.wait(redis_client, job_id, wait)
+    except Exception as e:
+        logger.error(f"분석 작업 조회 중 오류 발생: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="분석 작업 조회 중 오류가 발생했습니다."
+        )
+    
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"'{job_id}' 작업을 찾을 수 없습니다."
+        )
+    return job
+
+@router.post("/jargon/batch", response_model=JargonBatchResponse)
+async def get_jargons_batch(
+    request: JargonBatchRequest,
+    db: AsyncSession = Depends(get_read_db),
+    redis_client = Depends(get_redis)
+):
+    """
+    여러 신조어를 한 번에 조회합니다.
+    캐시와 DB에 있는 단어는 즉시 반환하고, 나머지는 LLM 분석을 예약한 뒤 pending으로 표시합니다.
+    """
+    try:
+        results, pending = await jargon_service.get_interpretations(
+            request.words, db, redis_client
+        )
+        return Response(
+            content=jargon_service.encode_batch(results, pending),
+            media_type="application/json"
+        )
+        
+    except Exception as e:
+        logger.error(f"신조어 일괄 조회 중 오류 발생: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="일괄 조회 중 오류가 발생했습니다."
+        )
+
+@router.post("/jargon/scan", response_model=JargonScanResponse)
+async def scan_text(
+    request: JargonScanRequest,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    텍스트에서 DB에 등록된 모든 신조어의 출현 위치를 찾습니다.
+    """
+    try:
+        matches = await jargon_scanner.scan(request.text, db)
+        return JargonScanResponse(
+            matches=[JargonMatch(word=word, start=start, end=end) for start, end, word in matches],
+            words=list(dict.fromkeys(word for _, _, word in matches))
+        )
+        
+    except Exception as e:
+        logger.error(f"텍스트 스캔 중 오류 발생: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="텍스트 스캔 중 오류가 발생했습니다."
+        )
+
 @router.put("/jargon/{word}")
 async def update_jargon(
     word: str,
     update_data: JargonUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     redis_client = Depends(get_redis)
 ):
     """
     신조어 정보를 사용자가 수정합니다.
     """
     try:
-        jargon = db.query(Jargon).filter(Jargon.word == word).first()
+        result = await db.execute(select(Jargon).where(Jargon.word == word))
+        jargon = result.scalar_one_or_none()
         
         if not jargon:
             raise HTTPException(
@@ -118,15 +424,17 @@ async def update_jargon(
             jargon.modified_by = update_data.modified_by
             jargon.is_user_modified = True
         
-        db.commit()
-        db.refresh(jargon)
+        await db.commit()
+        await db.refresh(jargon)
+        await jargon_service.on_jargons_saved(redis_client, [jargon])
         
-        # Redis 캐시 삭제
-        cache_key = f"jargon:{word}"
-        redis_client.delete(cache_key)
+        # 모든 캐시 계층에서 삭제한 뒤 수정한 값을 바로 기록
+        # (지연된 복제본에서 읽은 이전 값이 캐시에 다시 채워지지 않도록)
+        await jargon_service.invalidate(word, redis_client)
+        await jargon_service.cache_jargons([jargon])
         
         logger.info(f"'{word}' 정보 수정 완료")
-        return {"message": "수정 완료", "jargon": jargon}
+        return {"message": "수정 완료", "jargon": jargon_service.serialize_jargon(jargon)}
         
     except Exception as e:
         logger.error(f"신조어 수정 중 오류 발생: {e}")
@@ -137,15 +445,21 @@ async def update_jargon(
 
 @router.get("/jargon", response_model=List[JargonResponse])
 async def list_jargons(
+    response: Response,
+    after_id: Optional[int] = None,
     skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     저장된 신조어 목록을 조회합니다.
+    after_id(커서)를 사용하면 테이블 크기와 무관하게 일정한 속도로 다음 페이지를 조회합니다.
+    다음 페이지 커서는 X-Next-Cursor 헤더로 반환합니다.
     """
     try:
-        jargons = db.query(Jargon).offset(skip).limit(limit).all()
+        jargons = await jargon_service.list_jargons(db, limit, after_id=after_id, skip=skip)
+        if len(jargons) == limit:
+            response.headers["X-Next-Cursor"] = str(jargons[-1].id)
         return jargons
     except Exception as e:
         logger.error(f"신조어 목록 조회 중 오류 발생: {e}")
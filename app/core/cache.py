@@ -0,0 +1,75 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Hashable, Optional
+import time
+
+
+class LocalCache:
+    """프로세스 내 LRU + TTL 캐시"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """키에 해당하는 값을 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """값을 저장하고, 최대 크기를 넘으면 가장 오래 사용되지 않은 항목을 제거합니다."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TierStats:
+    """캐시 계층별 hit/miss 카운터"""
+
+    def __init__(self, *tiers: str):
+        self._counts: Dict[str, Dict[str, int]] = {
+            tier: {"hit": 0, "miss": 0} for tier in tiers
+        }
+
+    def hit(self, tier: str) -> None:
+        self._counts[tier]["hit"] += 1
+
+    def miss(self, tier: str) -> None:
+        self._counts[tier]["miss"] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """계층별 카운터와 적중률을 반환합니다."""
+        result = {}
+        for tier, counts in self._counts.items():
+            total = counts["hit"] + counts["miss"]
+            result[tier] = {
+                **counts,
+                "hit_ratio": round(counts["hit"] / total, 4) if total else 0.0,
+            }
+        return result
@@ -1,42 +1,248 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import exc, make_url, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from prometheus_client import REGISTRY
+from typing import Dict, List, Optional, Set
 from app.core.config import settings
-import redis
+from app.core.metrics import (
+    DB_POOL_TIMEOUTS,
+    DB_POOL_WAIT,
+    DB_READ_SESSIONS,
+    DB_REPLICA_LAG,
+    DBPoolCollector
+)
+import redis.asyncio as aioredis
+import asyncio
+import itertools
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
-# PostgreSQL 데이터베이스 설정
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def _async_database_url(url: str) -> str:
+    """동기 드라이버 URL을 비동기 드라이버(asyncpg, aiosqlite) URL로 변환합니다."""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return url
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """커넥션을 얻기까지 기다린 시간과 pool_timeout 초과 횟수를 기록하는 커넥션 풀"""
+
+    label = "primary"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            DB_POOL_TIMEOUTS.labels(self.label).inc()
+            raise
+        finally:
+            DB_POOL_WAIT.labels(self.label).observe(time.perf_counter() - started)
+
+
+def _create_engine(url: str, label: str) -> AsyncEngine:
+    """풀 설정을 적용한 비동기 엔진을 만듭니다. label은 풀 지표의 pool 레이블로 사용됩니다."""
+    url = _async_database_url(url)
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        # 메모리 SQLite는 커넥션 하나를 공유하는 StaticPool을 그대로 사용합니다.
+        return create_async_engine(url)
+    return create_async_engine(
+        url,
+        poolclass=type(f"TimedQueuePool[{label}]", (TimedQueuePool,), {"label": label}),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING
+    )
+
+
+# PostgreSQL 데이터베이스 설정 (비동기 엔진)
+engine = _create_engine(settings.DATABASE_URL, "primary")
+AsyncSessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
 Base = declarative_base()
 
-# Redis 연결
-redis_client = redis.Redis(
+# 읽기 전용 복제본 (설정하지 않으면 읽기도 primary로 보냄)
+replica_engines: Dict[str, AsyncEngine] = {
+    f"replica-{index}": _create_engine(url.strip(), f"replica-{index}")
+    for index, url in enumerate(settings.DATABASE_REPLICA_URLS.split(","))
+    if url.strip()
+}
+ReadSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+REGISTRY.register(DBPoolCollector({"primary": engine, **replica_engines}))
+
+# PostgreSQL 복제본의 재생 지연 (수신한 WAL을 모두 재생했으면 0)
+_REPLICA_LAG_SQL = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END"
+)
+
+
+class ReplicaRouter:
+    """
+    읽기 세션을 복제본에 분산하고, 지연이 max_lag를 넘거나 연결할 수 없는 복제본은 제외합니다.
+    사용할 수 있는 복제본이 없으면 primary로 보냅니다.
+    복제본 상태는 check_interval마다 백그라운드에서 확인합니다.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Dict[str, AsyncEngine],
+        max_lag: float,
+        check_interval: float
+    ):
+        self.primary = primary
+        self.replicas = replicas
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        # 첫 확인 전에는 모든 복제본을 사용하지 않습니다.
+        self._healthy: List[str] = []
+        self._cycle = itertools.cycle(())
+        self._down: Set[str] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    async def _measure_lag(self, engine: AsyncEngine) -> float:
+        """복제본 지연 시간(초)을 반환합니다."""
+        async with engine.connect() as conn:
+            if engine.dialect.name == "postgresql":
+                return float(await conn.scalar(_REPLICA_LAG_SQL))
+            # 다른 DB(로컬 테스트용 SQLite 등)는 연결 여부만 확인합니다.
+            await conn.execute(text("SELECT 1"))
+            return 0.0
+
+    async def check(self) -> None:
+        lags = await asyncio.gather(*(
+            asyncio.wait_for(self._measure_lag(replica), self.check_interval)
+            for replica in self.replicas.values()
+        ), return_exceptions=True)
+
+        healthy = []
+        for name, lag in zip(self.replicas, lags):
+            if isinstance(lag, BaseException):
+                DB_REPLICA_LAG.labels(name).set(-1)
+                problem = f"연결 실패 ({lag!r})"
+            else:
+                DB_REPLICA_LAG.labels(name).set(lag)
+                if lag <= self.max_lag:
+                    healthy.append(name)
+                    self._down.discard(name)
+                    continue
+                problem = f"지연 {lag:.1f}초"
+            # 같은 복제본의 문제는 상태가 바뀔 때 한 번만 기록합니다.
+            if name not in self._down:
+                logger.warning(f"DB 복제본 {name}을 읽기에서 제외: {problem}")
+                self._down.add(name)
+
+        if healthy != self._healthy:
+            logger.info(f"읽기 복제본 변경: {self._healthy} → {healthy}")
+            self._healthy = healthy
+            self._cycle = itertools.cycle(healthy)
+
+    def read_engine(self) -> AsyncEngine:
+        """읽기 세션에 사용할 엔진을 고릅니다."""
+        if not self._healthy:
+            DB_READ_SESSIONS.labels("primary").inc()
+            return self.primary
+        name = next(self._cycle)
+        DB_READ_SESSIONS.labels(name).inc()
+        return self.replicas[name]
+
+    async def _run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self.check_interval)
+
+    def start(self) -> None:
+        if self.replicas and self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+replica_router = ReplicaRouter(
+    primary=engine,
+    replicas=replica_engines,
+    max_lag=settings.DB_REPLICA_MAX_LAG,
+    check_interval=settings.DB_REPLICA_CHECK_INTERVAL
+)
+
+# Redis 연결 (비동기 커넥션 풀)
+redis_pool = aioredis.ConnectionPool(
     host=settings.REDIS_HOST,
     port=settings.REDIS_PORT,
     db=settings.REDIS_DB,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
     decode_responses=True
 )
+redis_client = aioredis.Redis(connection_pool=redis_pool)
 
-def get_db():
-    """데이터베이스 세션을 반환하는 의존성 함수"""
-    db = SessionLocal()
-    try:
+# 직렬화된 응답 캐시용 Redis 연결 (bytes를 그대로 읽고 씀)
+redis_binary_pool = aioredis.ConnectionPool(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    db=settings.REDIS_DB,
+    max_connections=settings.REDIS_MAX_CONNECTIONS
+)
+redis_binary_client = aioredis.Redis(connection_pool=redis_binary_pool)
+
+async def get_db():
+    """데이터베이스 세션을 반환하는 의존성 함수 (primary, 쓰기와 최신 데이터가 필요한 읽기용)"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def get_read_db():
+    """읽기 전용 세션을 반환하는 의존성 함수 (복제본, 없으면 primary)"""
+    async with ReadSessionLocal(bind=replica_router.read_engine()) as db:
         yield db
-    finally:
-        db.close()
 
 def get_redis():
     """Redis 클라이언트를 반환하는 의존성 함수"""
     return redis_client
 
-def init_db():
+def get_redis_binary():
+    """응답 캐시용 bytes Redis 클라이언트를 반환합니다."""
+    return redis_binary_client
+
+async def init_db():
     """데이터베이스 초기화"""
     try:
-        Base.metadata.create_all(bind=engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
         logger.info("데이터베이스 테이블 생성 완료")
     except Exception as e:
         logger.error(f"데이터베이스 초기화 오류: {e}")
-        raise 
\ No newline at end of file
+        raise
+
+async def close_db():
+    """데이터베이스 엔진과 Redis 연결을 정리합니다."""
+    await engine.dispose()
+    for replica in replica_engines.values():
+        await replica.dispose()
+    await redis_client.aclose()
+    await redis_binary_client.aclose()
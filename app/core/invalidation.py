@@ -0,0 +1,97 @@
+import asyncio
+import json
+import logging
+import uuid
+from typing import Callable, Iterable, List, Optional
+
+import redis
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidationBus:
+    """
+    Redis pub/sub으로 워커 간 캐시 무효화 이벤트를 주고받습니다.
+    각 워커는 백그라운드에서 채널을 구독해 다른 워커가 보낸 단어를 on_invalidate로 전달하고,
+    구독이 끊겼다가 다시 연결되면 그동안 놓친 이벤트가 있을 수 있으므로 on_reset을 호출합니다.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        on_invalidate: Callable[[List[str]], None],
+        on_reset: Callable[[], None],
+        retry_interval: float = 1.0
+    ):
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self._on_invalidate = on_invalidate
+        self._on_reset = on_reset
+        self.retry_interval = retry_interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def publish(self, redis_client: Redis, words: Iterable[str]) -> None:
+        words = list(dict.fromkeys(words))
+        if not words:
+            return
+        message = json.dumps({"origin": self.origin, "words": words}, ensure_ascii=False)
+        try:
+            await redis_client.publish(self.channel, message)
+        except redis.RedisError as e:
+            logger.warning(f"캐시 무효화 이벤트 발행 실패 ({len(words)}개): {e}")
+
+    async def publish_reset(self, redis_client: Redis) -> None:
+        """모든 워커가 on_reset으로 프로세스 내 캐시를 비우게 합니다."""
+        message = json.dumps({"origin": self.origin, "reset": True})
+        try:
+            await redis_client.publish(self.channel, message)
+        except redis.RedisError as e:
+            logger.warning(f"캐시 초기화 이벤트 발행 실패: {e}")
+
+    def _handle(self, data: str) -> None:
+        try:
+            message = json.loads(data)
+        except ValueError:
+            logger.warning(f"잘못된 캐시 무효화 이벤트 무시: {data!r}")
+            return
+        # 자신이 보낸 이벤트는 발행 전에 이미 반영했습니다.
+        if message.get("origin") == self.origin:
+            return
+        if message.get("reset"):
+            self._on_reset()
+        else:
+            self._on_invalidate(message.get("words", []))
+
+    async def _listen(self, redis_client: Redis) -> None:
+        missed = False
+        while True:
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                if missed:
+                    logger.info("캐시 무효화 채널 재구독: 프로세스 내 캐시를 비웁니다.")
+                    self._on_reset()
+                    missed = False
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._handle(message["data"])
+            except redis.RedisError as e:
+                logger.warning(f"캐시 무효화 채널 구독 실패: {e}")
+                missed = True
+            finally:
+                await pubsub.aclose()
+            await asyncio.sleep(self.retry_interval)
+
+    def start(self, redis_client: Redis) -> None:
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._listen(redis_client))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,153 @@
+import time
+from typing import Dict, Iterator, Mapping
+
+from fastapi import Request
+from prometheus_client import Counter, Gauge, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from app.core.cache import TierStats
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "라우트별 요청 처리 시간 (스트리밍 응답은 응답 헤더 전송까지)",
+    ["method", "route", "status"]
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "처리 중인 요청 수"
+)
+STAGE_LATENCY = Histogram(
+    "jargon_stage_duration_seconds",
+    "조회/분석 단계별 처리 시간",
+    ["stage"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+LLM_TOKENS = Counter(
+    "llm_tokens_total",
+    "LLM 사용 토큰 수 (usage 정보가 없으면 추정치)",
+    ["kind"]
+)
+LLM_REQUESTS = Counter(
+    "llm_requests_total",
+    "LLM 호출 결과별 횟수",
+    ["outcome"]
+)
+LLM_IN_FLIGHT = Gauge(
+    "llm_requests_in_flight",
+    "진행 중인 LLM 호출 수"
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "DB 커넥션 풀에서 커넥션을 얻기까지 기다린 시간",
+    ["pool"],
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30)
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "pool_timeout 안에 커넥션을 얻지 못한 횟수",
+    ["pool"]
+)
+DB_READ_SESSIONS = Counter(
+    "db_read_sessions_total",
+    "읽기 세션이 연결된 DB별 횟수 (사용 가능한 복제본이 없으면 primary)",
+    ["target"]
+)
+DB_REPLICA_LAG = Gauge(
+    "db_replica_lag_seconds",
+    "마지막 확인 시점의 복제본 지연 시간 (연결 실패 시 -1)",
+    ["replica"]
+)
+
+
+def stage(name: str):
+    """`with stage("redis"):` 형태로 단계별 처리 시간을 기록합니다."""
+    return STAGE_LATENCY.labels(name).time()
+
+
+class TierStatsCollector:
+    """조회 시점의 TierStats 값을 계층별 hit/miss 카운터와 적중률로 내보냅니다."""
+
+    def __init__(self, prefix: str, stats: TierStats):
+        self.prefix = prefix
+        self.stats = stats
+
+    def collect(self) -> Iterator:
+        lookups = CounterMetricFamily(
+            f"{self.prefix}_lookups", "캐시 계층별 조회 수", labels=["tier", "result"]
+        )
+        ratio = GaugeMetricFamily(
+            f"{self.prefix}_hit_ratio", "캐시 계층별 적중률", labels=["tier"]
+        )
+        for tier, counts in self.stats.snapshot().items():
+            lookups.add_metric([tier, "hit"], counts["hit"])
+            lookups.add_metric([tier, "miss"], counts["miss"])
+            ratio.add_metric([tier], counts["hit_ratio"])
+        yield lookups
+        yield ratio
+
+
+class DBPoolCollector:
+    """엔진(primary, 복제본)별 DB 커넥션 풀의 크기와 사용 중인 커넥션 수를 내보냅니다."""
+
+    def __init__(self, engines: Mapping[str, AsyncEngine]):
+        self.engines = engines
+
+    def collect(self) -> Iterator:
+        families = {
+            "size": GaugeMetricFamily("db_pool_size", "설정된 풀 크기", labels=["pool"]),
+            "checked_out": GaugeMetricFamily("db_pool_checked_out", "사용 중인 커넥션 수", labels=["pool"]),
+            "overflow": GaugeMetricFamily(
+                "db_pool_overflow", "풀 크기를 넘어 추가로 연 커넥션 수", labels=["pool"]
+            ),
+            "saturation": GaugeMetricFamily(
+                "db_pool_saturation", "최대 커넥션 수 대비 사용 중인 커넥션 비율", labels=["pool"]
+            ),
+        }
+        for name, engine in self.engines.items():
+            # 엔진을 dispose하면 풀이 새로 만들어지므로 매번 engine.pool을 읽습니다.
+            pool = engine.pool
+            if not isinstance(pool, QueuePool):
+                continue
+            capacity = pool.size() + max(pool._max_overflow, 0)
+            families["size"].add_metric([name], pool.size())
+            families["checked_out"].add_metric([name], pool.checkedout())
+            families["overflow"].add_metric([name], max(pool.overflow(), 0))
+            families["saturation"].add_metric(
+                [name], pool.checkedout() / capacity if capacity else 0.0
+            )
+        yield from families.values()
+
+_route_paths: Dict[object, str] = {}
+
+
+def _route_path(request: Request) -> str:
+    """요청 경로 대신 라우트 템플릿(/api/v1/jargon/{word})을 레이블로 사용합니다."""
+    endpoint = request.scope.get("endpoint")
+    if endpoint is None:
+        return "unmatched"
+    if not _route_paths:
+        for route in request.app.routes:
+            if hasattr(route, "endpoint"):
+                _route_paths[route.endpoint] = route.path
+    return _route_paths.get(endpoint, "unmatched")
+
+
+async def metrics_middleware(request: Request, call_next):
+    """라우트별 요청 처리 시간과 처리 중인 요청 수를 기록합니다."""
+    if request.url.path == "/metrics":
+        return await call_next(request)
+
+    REQUESTS_IN_FLIGHT.inc()
+    started = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        REQUESTS_IN_FLIGHT.dec()
+        REQUEST_LATENCY.labels(
+            request.method, _route_path(request), str(status_code)
+        ).observe(time.perf_counter() - started)
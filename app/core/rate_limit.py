@@ -0,0 +1,258 @@
+import hashlib
+import ipaddress
+import logging
+from collections import Counter
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Union
+
+import redis
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.core.database import get_redis
+
+logger = logging.getLogger(__name__)
+
+# 현재 요청의 클라이언트 식별자와 일일 LLM 토큰 예산 초과 여부 (LLM 호출 시 참조)
+client_key: ContextVar[Optional[str]] = ContextVar("client_key", default=None)
+budget_exhausted: ContextVar[bool] = ContextVar("budget_exhausted", default=False)
+
+# 여러 요청이 함께 기다리는 LLM 호출(병합, 배치)의 사용량을 나눌 클라이언트 목록.
+# 항목은 클라이언트 식별자이거나 다른 호출의 목록이며, 호출이 끝날 때까지 대기자가 추가될 수 있습니다.
+Payers = List[Union[Optional[str], "Payers"]]
+usage_payers: ContextVar[Optional[Payers]] = ContextVar("usage_payers", default=None)
+
+# LLM을 호출하는 분석 요청 경로
+LLM_PATH_PREFIX = "/api/v1/jargon/analyze"
+
+# 토큰 버킷 차감과 오늘의 LLM 토큰 사용량 조회를 한 번에 처리합니다.
+# KEYS[1]: 토큰 버킷 해시, KEYS[2]: 일일 토큰 사용량
+# ARGV: 버킷 크기, 초당 충전량, 이번 요청의 비용
+_RATE_LIMIT_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local time = redis.call("time")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local bucket = redis.call("hmget", KEYS[1], "tokens", "ts")
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_after = math.ceil((cost - tokens) / rate)
+end
+redis.call("hset", KEYS[1], "tokens", tostring(tokens), "ts", tostring(now))
+redis.call("expire", KEYS[1], math.ceil((capacity - tokens) / rate) + 1)
+
+local used = tonumber(redis.call("get", KEYS[2]) or "0")
+return {allowed, math.floor(tokens), retry_after, used}
+"""
+
+# 토큰 버킷에서 비용을 추가로 차감합니다. 버킷이 음수가 되면 다시 충전될 때까지 요청이 거부됩니다.
+# KEYS[1]: 토큰 버킷 해시
+# ARGV: 버킷 크기, 초당 충전량, 추가 비용
+_CHARGE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local time = redis.call("time")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local bucket = redis.call("hmget", KEYS[1], "tokens", "ts")
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate) - cost
+
+redis.call("hset", KEYS[1], "tokens", tostring(tokens), "ts", tostring(now))
+redis.call("expire", KEYS[1], math.ceil((capacity - tokens) / rate) + 1)
+return math.floor(tokens)
+"""
+
+# 일일 토큰 사용량을 늘리고, 처음 기록할 때 만료 시간을 설정합니다.
+_CONSUME_BUDGET_SCRIPT = """
+local used = redis.call("incrby", KEYS[1], ARGV[1])
+if used == tonumber(ARGV[1]) then
+    redis.call("expire", KEYS[1], ARGV[2])
+end
+return used
+"""
+
+
+def _key_hash(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:32]
+
+
+def _split(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+# 등록된 API 키 (해시로만 보관)와 X-Real-IP를 믿을 수 있는 프록시 주소
+_API_KEY_HASHES = {_key_hash(api_key) for api_key in _split(settings.API_KEYS)}
+_TRUSTED_PROXIES = [ipaddress.ip_network(network, strict=False) for network in _split(settings.TRUSTED_PROXIES)]
+
+
+def _is_trusted_proxy(host: str) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in _TRUSTED_PROXIES)
+
+
+def identify_client(request: Request) -> str:
+    """
+    등록된 API 키면 키의 해시로, 아니면 접속한 주소로 식별합니다.
+    X-Real-IP는 신뢰하는 프록시(nginx)를 거쳐 온 요청에서만 사용합니다.
+    등록되지 않은 API 키는 무시하므로, 키를 바꿔 가며 보내도 같은 주소의 버킷을 사용합니다.
+    """
+    api_key = request.headers.get("x-api-key")
+    if api_key:
+        digest = _key_hash(api_key)
+        if digest in _API_KEY_HASHES:
+            return "key:" + digest
+    peer = request.client.host if request.client else "unknown"
+    real_ip = request.headers.get("x-real-ip")
+    if real_ip and _is_trusted_proxy(peer):
+        return f"ip:{real_ip.strip()}"
+    return f"ip:{peer}"
+
+
+def bucket_key(client: str) -> str:
+    return f"ratelimit:{client}"
+
+
+def budget_key(client: str) -> str:
+    return f"llm:budget:{client}:{datetime.now(timezone.utc):%Y%m%d}"
+
+
+async def charge(redis_client: Redis, cost: int) -> None:
+    """
+    현재 클라이언트의 버킷에서 cost만큼 추가로 차감합니다.
+    미들웨어가 요청 1건의 비용을 확인한 뒤 본문 크기에 비례한 비용을 더할 때 사용하며,
+    남은 양보다 크면 버킷이 음수가 되어 그만큼 충전될 때까지 다음 요청이 거부됩니다.
+    """
+    client = client_key.get()
+    if not settings.RATE_LIMIT_ENABLED or client is None or cost <= 0:
+        return
+    try:
+        await redis_client.eval(
+            _CHARGE_SCRIPT, 1, bucket_key(client),
+            settings.RATE_LIMIT_CAPACITY, settings.RATE_LIMIT_REFILL_RATE, cost
+        )
+    except redis.RedisError as e:
+        logger.warning(f"요청 비용 차감 실패: {e}")
+
+
+async def daily_usage(redis_client: Redis, client: Optional[str]) -> int:
+    """클라이언트가 오늘 사용한 LLM 토큰 수를 반환합니다. 확인할 수 없으면 0을 반환합니다."""
+    if client is None:
+        return 0
+    try:
+        used = await redis_client.get(budget_key(client))
+    except redis.RedisError as e:
+        logger.warning(f"LLM 토큰 사용량 조회 실패: {e}")
+        return 0
+    return int(used or 0)
+
+
+def current_payers() -> Payers:
+    """현재 작업에서 발생하는 LLM 사용량을 나눌 클라이언트 목록을 반환합니다."""
+    payers = usage_payers.get()
+    return payers if payers is not None else [client_key.get()]
+
+
+def _flatten(payers: Payers) -> Iterable[Optional[str]]:
+    for payer in payers:
+        if isinstance(payer, list):
+            yield from _flatten(payer)
+        else:
+            yield payer
+
+
+def split_usage(tokens: int, payers: Payers) -> Counter:
+    """토큰을 대기자 수만큼 똑같이 나눕니다. 나머지는 앞쪽 대기자부터 1씩 더합니다."""
+    clients = list(_flatten(payers))
+    shares: Counter = Counter()
+    if not clients:
+        return shares
+    base, extra = divmod(tokens, len(clients))
+    for index, client in enumerate(clients):
+        amount = base + (index < extra)
+        # 식별자가 없는 내부 작업(워밍업 등)의 몫은 차감하지 않습니다.
+        if client is not None and amount:
+            shares[client] += amount
+    return shares
+
+
+async def record_llm_usage(redis_client: Redis, tokens: int) -> None:
+    """LLM 사용 토큰을 호출 결과를 기다린 클라이언트들의 일일 예산에서 나누어 차감합니다."""
+    if tokens <= 0:
+        return
+    shares = split_usage(tokens, current_payers())
+    if not shares:
+        return
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for client, amount in shares.items():
+                pipe.eval(_CONSUME_BUDGET_SCRIPT, 1, budget_key(client), amount, 2 * 24 * 3600)
+            used = await pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"LLM 토큰 사용량 기록 실패: {e}")
+        return
+    for client, total in zip(shares, used):
+        if total >= settings.LLM_DAILY_TOKEN_BUDGET:
+            logger.info(f"일일 LLM 토큰 예산 소진: {client} ({total} 토큰)")
+
+
+async def rate_limit_middleware(request: Request, call_next):
+    """
+    클라이언트별 토큰 버킷으로 API 요청 수를 제한하고,
+    일일 LLM 토큰 예산을 다 쓴 클라이언트의 분석 요청을 거부합니다.
+    Redis를 사용할 수 없으면 제한 없이 통과시킵니다.
+    """
+    path = request.url.path
+    if not settings.RATE_LIMIT_ENABLED or request.method == "OPTIONS" or not path.startswith("/api/"):
+        return await call_next(request)
+
+    client = identify_client(request)
+    is_llm_request = request.method == "POST" and path.startswith(LLM_PATH_PREFIX)
+    cost = settings.RATE_LIMIT_LLM_COST if is_llm_request else 1
+
+    try:
+        allowed, remaining, retry_after, used = await get_redis().eval(
+            _RATE_LIMIT_SCRIPT, 2, bucket_key(client), budget_key(client),
+            settings.RATE_LIMIT_CAPACITY, settings.RATE_LIMIT_REFILL_RATE, cost
+        )
+    except redis.RedisError as e:
+        logger.warning(f"요청 수 제한 확인 실패: {e}")
+        return await call_next(request)
+
+    if not allowed:
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"detail": "요청이 너무 많습니다. 잠시 후 다시 시도해주세요."},
+            headers={"Retry-After": str(retry_after), "X-RateLimit-Remaining": "0"}
+        )
+
+    exhausted = used >= settings.LLM_DAILY_TOKEN_BUDGET
+    if exhausted and is_llm_request:
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"detail": "오늘의 LLM 사용량을 모두 사용했습니다."}
+        )
+
+    client_key.set(client)
+    budget_exhausted.set(exhausted)
+    response = await call_next(request)
+    response.headers["X-RateLimit-Remaining"] = str(remaining)
+    return response
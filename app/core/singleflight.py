@@ -0,0 +1,48 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from app.core import rate_limit
+
+
+class SingleFlight:
+    """
+    같은 키에 대한 동시 비동기 호출을 하나로 합칩니다.
+    첫 호출만 실제 작업을 실행하고, 나머지 호출은 같은 결과를 기다립니다.
+    작업 중 발생한 LLM 사용량은 첫 호출자만이 아니라 결과를 기다린 모든 호출자에게 나누어 차감합니다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, Tuple[asyncio.Task, rate_limit.Payers]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        flight = self._inflight.get(key)
+        if flight is None:
+            payers = [rate_limit.current_payers()]
+            task = asyncio.ensure_future(self._run(fn, payers))
+            self._inflight[key] = (task, payers)
+            task.add_done_callback(lambda t: self._forget(key, t))
+        else:
+            task, payers = flight
+            payers.append(rate_limit.current_payers())
+
+        # 요청 하나가 취소되어도 다른 대기자를 위해 작업은 계속 진행합니다.
+        return await asyncio.shield(task)
+
+    @staticmethod
+    async def _run(fn: Callable[[], Awaitable[Any]], payers: rate_limit.Payers) -> Any:
+        rate_limit.usage_payers.set(payers)
+        return await fn()
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        flight = self._inflight.get(key)
+        if flight is not None and flight[0] is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # 대기자가 모두 취소된 경우에도 예외가 경고로 남지 않도록 소비합니다.
+            task.exception()
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    def __len__(self) -> int:
+        return len(self._inflight)
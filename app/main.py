@@ -1,9 +1,20 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response, status
+from fastapi.responses import JSONResponse, ORJSONResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 import logging
 from app.core.config import settings
-from app.api.v1 import jargon_router
+from app.core.database import close_db, get_redis, replica_router
+from app.core.metrics import metrics_middleware
+from app.core.rate_limit import rate_limit_middleware
+from app.api.v1 import admin_router, jargon_router
+from app.services.counter_service import search_counter
+from app.services.fuzzy_index import fuzzy_index
+from app.services.jargon_service import invalidation_bus
+from app.services.job_service import analysis_jobs
+from app.services.warmup_service import cache_warmer
+from app.services.llm_client import llm_client
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -13,9 +24,16 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="LLM 신조어 분석 API",
     description="웹페이지의 신조어를 분석하고 GPT를 통해 설명을 제공하는 API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# 요청 수 제한 미들웨어 (CORS 미들웨어 안쪽에서 실행되도록 먼저 등록)
+app.middleware("http")(rate_limit_middleware)
+
+# 요청 지표 미들웨어 (요청 수 제한으로 거부된 요청도 기록)
+app.middleware("http")(metrics_middleware)
+
 # CORS 미들웨어 설정
 app.add_middleware(
     CORSMiddleware,
@@ -27,6 +45,27 @@ app.add_middleware(
 
 # 라우터 등록
 app.include_router(jargon_router.router, prefix="/api/v1")
+app.include_router(admin_router.router, prefix="/api/v1")
+
+@app.on_event("startup")
+async def startup():
+    """캐시 워밍업과 백그라운드 작업을 시작합니다."""
+    replica_router.start()
+    invalidation_bus.start(get_redis())
+    cache_warmer.start()
+    fuzzy_index.start()
+    search_counter.start(get_redis())
+    analysis_jobs.start(get_redis())
+
+@app.on_event("shutdown")
+async def shutdown():
+    """남은 조회수를 반영하고 DB 엔진과 Redis 커넥션 풀을 정리합니다."""
+    await analysis_jobs.stop()
+    await search_counter.stop(get_redis())
+    await invalidation_bus.stop()
+    await replica_router.stop()
+    await llm_client.aclose()
+    await close_db()
 
 @app.get("/")
 async def root():
@@ -34,7 +73,18 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    # 캐시 워밍업이 끝나기 전에는 트래픽을 받지 않도록 503을 반환합니다.
+    if not cache_warmer.ready:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "warming_up"}
+        )
+    return {"status": "healthy", "warmed_up": cache_warmer.loaded}
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus 형식의 지표를 반환합니다."""
+    return Response(content=generate_latest(), headers={"Content-Type": CONTENT_TYPE_LATEST})
 
 if __name__ == "__main__":
     uvicorn.run(
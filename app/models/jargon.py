@@ -1,10 +1,23 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, DDL, Index, event
 from sqlalchemy.sql import func
 from app.core.database import Base
 
 class Jargon(Base):
     __tablename__ = "jargons"
-    
+    __table_args__ = (
+        # 검색 API의 부분 일치(ILIKE '%...%') 조회용 trigram 인덱스 (PostgreSQL 전용)
+        Index(
+            "ix_jargons_word_trgm", "word",
+            postgresql_using="gin",
+            postgresql_ops={"word": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_jargons_explanation_trgm", "explanation",
+            postgresql_using="gin",
+            postgresql_ops={"explanation": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     word = Column(String(100), unique=True, index=True, nullable=False)
     explanation = Column(Text, nullable=False)
@@ -14,6 +27,14 @@ class Jargon(Base):
     modified_by = Column(String(100), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    
+
     def __repr__(self):
-        return f"<Jargon(word='{self.word}', explanation='{self.explanation[:50]}...')>" 
\ No newline at end of file
+        return f"<Jargon(word='{self.word}', explanation='{self.explanation[:50]}...')>"
+
+
+# trigram 인덱스를 만들기 전에 pg_trgm 확장을 활성화합니다.
+event.listen(
+    Jargon.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 class JargonBase(BaseModel):
@@ -31,4 +31,45 @@ class JargonSearchRequest(BaseModel):
 
 class JargonAnalysisRequest(BaseModel):
     words: list[str]
-    context: Optional[str] = None 
\ No newline at end of file
+    context: Optional[str] = None
+
+class JargonBatchRequest(BaseModel):
+    words: List[str] = Field(..., min_length=1, max_length=500)
+
+class JargonBatchResponse(BaseModel):
+    results: Dict[str, Dict[str, Any]]
+    pending: List[str]
+
+class JargonScanRequest(BaseModel):
+    text: str = Field(..., max_length=200_000)
+
+class JargonMatch(BaseModel):
+    word: str
+    start: int
+    end: int
+
+class JargonScanResponse(BaseModel):
+    matches: List[JargonMatch]
+    words: List[str]
+
+class JargonJobRequest(BaseModel):
+    words: List[str] = Field(..., min_length=1, max_length=5000)
+    context: Optional[str] = None
+
+class JargonJobResponse(BaseModel):
+    job_id: str
+    status: str
+    words: List[str]
+    results: Optional[List[Dict[str, Any]]] = None
+    error: Optional[str] = None
+    attempts: int
+    created_at: float
+    updated_at: float
+
+class JargonSuggestion(BaseModel):
+    word: str
+    search_count: int
+
+class JargonAutocompleteResponse(BaseModel):
+    prefix: str
+    suggestions: List[JargonSuggestion]
@@ -1,59 +1,129 @@
-import openai
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Tuple
 import logging
 from app.core.config import settings
+from app.core.metrics import stage
+from app.services.llm_client import llm_client
+from app.services.response_parser import JargonResponseParser
 
 logger = logging.getLogger(__name__)
 
+SYSTEM_PROMPT = "당신은 한국어 신조어 분석 전문가입니다. 주어진 단어들의 의미와 출처를 정확하게 분석해주세요."
+
+# 분석 요청 생성 파라미터
+GENERATION_PARAMS = {"max_tokens": 1000, "temperature": 0.7}
+
 class AIService:
     def __init__(self):
-        if settings.OPENAI_API_KEY:
-            openai.api_key = settings.OPENAI_API_KEY
-        else:
+        if not settings.OPENAI_API_KEY:
             logger.warning("OpenAI API 키가 설정되지 않았습니다.")
     
-    async def analyze_jargon(self, words: List[str], context: str = None) -> List[Dict[str, Any]]:
+    async def analyze_jargon(
+        self,
+        words: List[str],
+        context: str = None,
+        retries: int = None
+    ) -> List[Dict[str, Any]]:
         """
         신조어들을 GPT API를 통해 분석합니다.
         
         Args:
             words: 분석할 신조어 리스트
             context: 추가 컨텍스트 정보
+            retries: 응답에서 누락된 단어를 다시 요청할 횟수 (기본값: LLM_PARSE_RETRIES)
             
         Returns:
             분석 결과 리스트
         """
+        results, _ = await self.analyze_jargon_raw(words, context, retries)
+        return results
+    
+    async def analyze_jargon_raw(
+        self,
+        words: List[str],
+        context: str = None,
+        retries: int = None
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """분석 결과와 함께 GPT 응답 원문(재요청 응답 포함)을 반환합니다."""
         if not settings.OPENAI_API_KEY:
             raise ValueError("OpenAI API 키가 필요합니다.")
         
         try:
-            # GPT API 요청을 위한 프롬프트 구성
-            prompt = self._build_analysis_prompt(words, context)
-            
-            response = await openai.ChatCompletion.acreate(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 한국어 신조어 분석 전문가입니다. 주어진 단어들의 의미와 출처를 정확하게 분석해주세요."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=1000,
-                temperature=0.7
-            )
+            results = []
+            completions = []
+            remaining = list(words)
+            if retries is None:
+                retries = settings.LLM_PARSE_RETRIES
+            for attempt in range(retries + 1):
+                response = await llm_client.chat(
+                    messages=self._build_messages(remaining, context),
+                    **GENERATION_PARAMS
+                )
+                
+                # 응답 파싱 및 결과 구성
+                completion = response.choices[0].message.content
+                completions.append(completion)
+                parser = self._parse(completion, remaining)
+                results.extend(parser.results)
+                
+                # 응답에서 빠진 단어만 다시 요청
+                remaining = parser.missing
+                if remaining:
+                    logger.warning(f"응답에서 누락된 단어 {len(remaining)}개: {remaining}")
+                if not remaining or attempt == retries:
+                    break
             
-            # 응답 파싱 및 결과 구성
-            result = self._parse_gpt_response(response.choices[0].message.content, words)
-            return result
+            return results, "\n---\n".join(completions)
             
         except Exception as e:
             logger.error(f"GPT API 호출 중 오류 발생: {e}")
             raise
     
+    async def stream_analysis(
+        self,
+        words: List[str],
+        context: str = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        신조어 분석 응답을 스트리밍합니다.
+        생성되는 토큰은 ("token", 텍스트)로, '---' 구분자까지 완성된 단어는 ("word", 결과)로 바로 전달하고,
+        마지막에 응답 원문 전체를 ("raw", 텍스트)로 전달합니다.
+        """
+        if not settings.OPENAI_API_KEY:
+            raise ValueError("OpenAI API 키가 필요합니다.")
+        
+        parser = JargonResponseParser(words)
+        chunks = []
+        async for delta in llm_client.stream_chat(
+            messages=self._build_messages(words, context),
+            **GENERATION_PARAMS
+        ):
+            chunks.append(delta)
+            yield "token", delta
+            for result in parser.feed(delta):
+                yield "word", result
+        
+        for result in parser.close():
+            yield "word", result
+        
+        # 스트림에서 빠진 단어만 다시 요청
+        if parser.missing and settings.LLM_PARSE_RETRIES > 0:
+            logger.warning(f"스트리밍 응답에서 누락된 단어 {len(parser.missing)}개: {parser.missing}")
+            retried, completion = await self.analyze_jargon_raw(
+                parser.missing, context, retries=settings.LLM_PARSE_RETRIES - 1
+            )
+            chunks.append("\n---\n" + completion)
+            for result in retried:
+                yield "word", result
+        
+        yield "raw", "".join(chunks)
+    
+    def _build_messages(self, words: List[str], context: str = None) -> List[Dict[str, str]]:
+        """GPT API 요청 메시지를 구성합니다."""
+        return [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": self._build_analysis_prompt(words, context)}
+        ]
+    
     def _build_analysis_prompt(self, words: List[str], context: str = None) -> str:
         """GPT API 요청을 위한 프롬프트를 구성합니다."""
         prompt = f"다음 신조어들의 의미와 출처를 분석해주세요:\n\n"
@@ -78,40 +148,31 @@ class AIService:
         
         return prompt
     
+    def _parse(self, response: str, words: List[str]) -> JargonResponseParser:
+        """GPT 응답 전체를 파싱한 파서를 반환합니다."""
+        with stage("parse"):
+            parser = JargonResponseParser(words)
+            parser.feed(response)
+            parser.close()
+        return parser
+    
     def _parse_gpt_response(self, response: str, words: List[str]) -> List[Dict[str, Any]]:
         """GPT 응답을 파싱하여 구조화된 데이터로 변환합니다."""
-        results = []
-        
-        # 응답을 단어별로 분리
-        sections = response.split("---")
-        
-        for section in sections:
-            if not section.strip():
-                continue
-                
-            lines = section.strip().split("\n")
-            word_data = {}
-            
-            for line in lines:
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    if key == "단어":
-                        word_data["word"] = value
-                    elif key == "의미":
-                        word_data["explanation"] = value
-                    elif key == "출처":
-                        word_data["source"] = value
-            
-            if word_data:
-                results.append(word_data)
-        
-        return results
+        return self._parse(response, words).results
+    
+    def parse_completion(self, completion: str, words: List[str]) -> List[Dict[str, Any]]:
+        """저장해 둔 GPT 응답 원문을 다시 파싱합니다."""
+        return self._parse_gpt_response(completion, words)
     
     async def get_single_word_analysis(self, word: str) -> Dict[str, Any]:
         """단일 신조어를 분석합니다."""
+        if settings.OPENAI_API_KEY:
+            results = await self.analyze_jargon([word])
+            for result in results:
+                if result.get("word") == word and result.get("explanation"):
+                    return result
+            return self.not_found_result(word)
+        
         # GPT API가 없을 때를 위한 임시 데이터
         if word == "갓생":
             return {
@@ -134,8 +195,22 @@ class AIService:
             }
         }
         
-        return test_data.get(word, {
+        return test_data.get(word, self.not_found_result(word))
+    
+    @staticmethod
+    def not_found_result(word: str) -> Dict[str, Any]:
+        """분석에 실패한 단어에 대한 기본 응답을 구성합니다."""
+        return {
             "word": word,
             "explanation": f"'{word}'에 대한 정보를 찾을 수 없습니다.",
             "source": "알 수 없음"
-        }) 
\ No newline at end of file
+        }
+    
+    @classmethod
+    def is_not_found(cls, result: Dict[str, Any]) -> bool:
+        """분석 결과가 기본 응답(정보 없음)인지 확인합니다."""
+        return result == cls.not_found_result(result.get("word", ""))
+
+
+# 애플리케이션 전체에서 공유하는 인스턴스
+ai_service = AIService()
@@ -0,0 +1,139 @@
+import asyncio
+import heapq
+import logging
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import LocalCache
+from app.core.config import settings
+from app.models.jargon import Jargon
+from app.services.fuzzy_index import canonical_key, decompose_jamo
+
+logger = logging.getLogger(__name__)
+
+# 접두어별로 미리 골라 두는 상위 항목 수 (API의 최대 limit)
+MAX_SUGGESTIONS = 50
+
+
+def prefix_key(text: str) -> str:
+    """
+    접두어 비교용 키. 정규화 후 자모 단위로 분해해 입력 중인 음절도 일치시킵니다.
+    (예: '킹ㅂ', '키' 모두 '킹받네'의 접두어)
+    """
+    return decompose_jamo(canonical_key(text))
+
+
+class PrefixIndex:
+    """
+    키 순서로 정렬된 배열에서 이진 탐색으로 접두어 범위를 찾고,
+    범위 안에서 조회수가 높은 순으로 상위 항목을 고릅니다.
+    짧은 접두어는 범위가 넓으므로 고른 결과를 접두어별로 캐시하고, 단어가 추가되면 해당 접두어만 비웁니다.
+    """
+
+    def __init__(self, items: Iterable[Tuple[str, int]] = (), cache_size: int = 10000):
+        items = list(items)
+        entries = sorted((prefix_key(word), word) for word, _ in items)
+        self._keys: List[str] = [key for key, _ in entries]
+        self._words: List[str] = [word for _, word in entries]
+        self._counts: Dict[str, int] = {word: count or 0 for word, count in items}
+        self._top = LocalCache(cache_size, float("inf"))
+
+    def add(self, word: str, count: int = 0) -> bool:
+        """단어를 추가합니다. 새로 추가된 경우 True를 반환합니다."""
+        if word in self._counts:
+            return False
+        key = prefix_key(word)
+        index = bisect_left(self._keys, key)
+        self._keys.insert(index, key)
+        self._words.insert(index, word)
+        self._counts[word] = count
+        for end in range(1, len(key) + 1):
+            self._top.delete(key[:end])
+        return True
+
+    def search(self, prefix: str, limit: int) -> List[Tuple[str, int]]:
+        """prefix로 시작하는 단어를 (단어, 조회수) 목록으로 조회수 높은 순서로 반환합니다."""
+        key = prefix_key(prefix)
+        if not key:
+            return []
+        if limit > MAX_SUGGESTIONS:
+            return self._select(key, limit)
+        top = self._top.get(key)
+        if top is None:
+            top = self._select(key, MAX_SUGGESTIONS)
+            self._top.set(key, top)
+        return top[:limit]
+
+    def _select(self, key: str, limit: int) -> List[Tuple[str, int]]:
+        start = bisect_left(self._keys, key)
+        end = bisect_left(self._keys, key[:-1] + chr(ord(key[-1]) + 1), start)
+        top = heapq.nsmallest(
+            limit, self._words[start:end], key=lambda word: (-self._counts[word], len(word), word)
+        )
+        return [(word, self._counts[word]) for word in top]
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+
+class Autocomplete:
+    """
+    Jargon 테이블의 단어와 조회수로 만든 접두어 인덱스를 관리합니다.
+    조회수 순위는 refresh_interval마다 DB에서 다시 읽고, 그 사이 저장된 단어는 바로 추가합니다.
+    """
+
+    def __init__(self, refresh_interval: float, cache_size: int):
+        self.refresh_interval = refresh_interval
+        self.cache_size = cache_size
+        self._index = PrefixIndex()
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        # 다시 읽는 동안 추가된 단어 (새 인덱스로 바꾼 뒤 다시 추가)
+        self._pending: Optional[List[str]] = None
+
+    def _stale(self) -> bool:
+        return self._loaded_at is None or time.monotonic() - self._loaded_at >= self.refresh_interval
+
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        if not self._stale():
+            return
+        # 다시 읽는 동안 다른 요청은 기존 인덱스로 응답합니다.
+        if self._loaded_at is not None and self._lock.locked():
+            return
+        async with self._lock:
+            if not self._stale():
+                return
+            self._pending = []
+            try:
+                result = await db.stream(select(Jargon.word, Jargon.search_count))
+                items = [(word, count) async for word, count in result]
+                # 정렬과 자모 분해는 오래 걸리므로 스레드에서 만든 뒤 참조만 바꿉니다.
+                index = await asyncio.to_thread(PrefixIndex, items, self.cache_size)
+                for word in self._pending:
+                    index.add(word)
+                self._index = index
+            finally:
+                self._pending = None
+            self._loaded_at = time.monotonic()
+            logger.info(f"자동완성 인덱스 로드 완료: {len(self._index)}개 단어")
+
+    def add_words(self, words: Iterable[str]) -> None:
+        """새로 저장된 단어를 인덱스에 추가합니다."""
+        for word in words:
+            self._index.add(word)
+            if self._pending is not None:
+                self._pending.append(word)
+
+    async def suggest(self, prefix: str, limit: int, db: AsyncSession) -> List[Tuple[str, int]]:
+        await self.ensure_loaded(db)
+        return self._index.search(prefix, limit)
+
+
+autocomplete = Autocomplete(
+    refresh_interval=settings.AUTOCOMPLETE_REFRESH_INTERVAL,
+    cache_size=settings.AUTOCOMPLETE_CACHE_SIZE
+)
@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import unicodedata
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.core import rate_limit
+from app.core.config import settings
+from app.services.ai_service import AIService, ai_service
+from app.services.llm_client import llm_client
+
+logger = logging.getLogger(__name__)
+
+AnalyzeFunc = Callable[[List[str]], Awaitable[List[Dict[str, Any]]]]
+
+
+def _match_key(word: str) -> str:
+    return unicodedata.normalize("NFC", word).strip().lower()
+
+
+class LLMBatchScheduler:
+    """
+    개별 단어 분석 요청을 짧은 시간 동안 모아 하나의 LLM 요청으로 보냅니다.
+    대기 시간(window), 최대 단어 수, 예상 토큰 예산 중 하나라도 넘으면 즉시 전송합니다.
+    예산 확인은 단어를 제출한 요청마다 하고, 사용량은 배치에 참여한 요청들에게 나누어 차감합니다.
+    """
+
+    def __init__(
+        self,
+        analyze: AnalyzeFunc,
+        window: float,
+        max_words: int,
+        token_budget: int,
+        tokens_per_word: int
+    ):
+        self._analyze = analyze
+        self.window = window
+        self.max_words = max_words
+        self.token_budget = token_budget
+        self.tokens_per_word = tokens_per_word
+        self._pending: List[Tuple[str, asyncio.Future, rate_limit.Payers]] = []
+        self._pending_tokens = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def _estimate_tokens(self, word: str) -> int:
+        """단어 하나의 프롬프트/응답 토큰 수를 대략적으로 추정합니다."""
+        return len(word) + self.tokens_per_word
+
+    async def submit(self, word: str) -> Dict[str, Any]:
+        """단어를 현재 배치에 추가하고 해당 단어의 분석 결과를 기다립니다."""
+        llm_client.check_budget()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        tokens = self._estimate_tokens(word)
+
+        # 이 단어를 더하면 토큰 예산을 넘는 경우 기존 배치를 먼저 전송합니다.
+        if self._pending and self._pending_tokens + tokens > self.token_budget:
+            self._flush()
+
+        self._pending.append((word, future, rate_limit.current_payers()))
+        self._pending_tokens += tokens
+
+        if len(self._pending) >= self.max_words:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        self._pending_tokens = 0
+        if batch:
+            asyncio.ensure_future(self._run_batch(batch))
+
+    async def _run_batch(self, batch: List[Tuple[str, asyncio.Future, rate_limit.Payers]]) -> None:
+        # 이 작업은 처음 제출한 요청의 컨텍스트를 물려받으므로, 사용량과 예산 상태를 배치 기준으로 바꿉니다.
+        rate_limit.usage_payers.set([payers for _, _, payers in batch])
+        rate_limit.budget_exhausted.set(False)
+        words = list(dict.fromkeys(word for word, _, _ in batch))
+        try:
+            results = await self._analyze(words)
+        except Exception as e:
+            logger.error(f"배치 분석 실패 ({len(words)}개 단어): {e}")
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_word = {
+            _match_key(result["word"]): result
+            for result in results
+            if result.get("word") and result.get("explanation")
+        }
+        logger.info(f"배치 분석 완료: 요청 {len(batch)}건, 단어 {len(words)}개, 결과 {len(by_word)}개")
+
+        for word, future, _ in batch:
+            if future.done():
+                continue
+            result = by_word.get(_match_key(word))
+            future.set_result(
+                {**result, "word": word} if result else AIService.not_found_result(word)
+            )
+
+
+async def _analyze_with_llm(words: List[str]) -> List[Dict[str, Any]]:
+    return await ai_service.analyze_jargon(words)
+
+
+# 단일 단어 조회에서 사용하는 프로세스 전역 스케줄러
+llm_batcher = LLMBatchScheduler(
+    _analyze_with_llm,
+    window=settings.LLM_BATCH_WINDOW_MS / 1000,
+    max_words=settings.LLM_BATCH_MAX_WORDS,
+    token_budget=settings.LLM_BATCH_TOKEN_BUDGET,
+    tokens_per_word=settings.LLM_BATCH_TOKENS_PER_WORD
+)
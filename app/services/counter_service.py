@@ -0,0 +1,116 @@
+import asyncio
+import logging
+from collections import Counter
+from typing import Optional
+
+import redis
+from redis.asyncio import Redis
+from sqlalchemy import bindparam, update
+
+from app.core.config import settings
+from app.core.database import engine
+from app.models.jargon import Jargon
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = "jargon:search_count:pending"
+FLUSHING_KEY = "jargon:search_count:flushing"
+FLUSH_LOCK_KEY = "jargon:search_count:lock"
+
+
+class SearchCounter:
+    """
+    조회수(search_count)를 요청마다 DB에 쓰지 않고 모아서 반영합니다.
+    프로세스 내 버퍼 → Redis HINCRBY 해시 → 주기적인 DB 일괄 UPDATE 순으로 전달됩니다.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._buffer: Counter = Counter()
+        self._task: Optional[asyncio.Task] = None
+
+    def increment(self, word: str, amount: int = 1) -> None:
+        self._buffer[word] += amount
+
+    async def flush_to_redis(self, redis_client: Redis) -> None:
+        """프로세스 내 버퍼를 Redis 해시로 옮깁니다."""
+        if not self._buffer:
+            return
+        buffer, self._buffer = self._buffer, Counter()
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for word, amount in buffer.items():
+                    pipe.hincrby(PENDING_KEY, word, amount)
+                await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"조회수 버퍼 Redis 반영 실패 ({len(buffer)}개): {e}")
+            self._buffer.update(buffer)
+
+    async def flush_to_db(self, redis_client: Redis) -> int:
+        """
+        Redis에 모인 조회수를 DB에 일괄 반영합니다.
+        여러 워커 중 lock을 잡은 하나만 반영하며, 반영한 단어 수를 반환합니다.
+        """
+        acquired = await redis_client.set(
+            FLUSH_LOCK_KEY, "1", nx=True, ex=max(int(self.interval * 6), 60)
+        )
+        if not acquired:
+            return 0
+
+        try:
+            # 이전 반영이 중간에 실패해 남은 해시가 있으면 그것부터 처리합니다.
+            if not await redis_client.exists(FLUSHING_KEY):
+                try:
+                    await redis_client.rename(PENDING_KEY, FLUSHING_KEY)
+                except redis.ResponseError:
+                    # 반영할 조회수가 없는 경우
+                    return 0
+
+            counts = await redis_client.hgetall(FLUSHING_KEY)
+            if counts:
+                table = Jargon.__table__
+                stmt = (
+                    update(table)
+                    .where(table.c.word == bindparam("b_word"))
+                    .values(search_count=table.c.search_count + bindparam("b_amount"))
+                )
+                async with engine.begin() as conn:
+                    await conn.execute(
+                        stmt,
+                        [
+                            {"b_word": word, "b_amount": int(amount)}
+                            for word, amount in sorted(counts.items())
+                        ]
+                    )
+            await redis_client.delete(FLUSHING_KEY)
+            return len(counts)
+        finally:
+            await redis_client.delete(FLUSH_LOCK_KEY)
+
+    async def flush(self, redis_client: Redis) -> None:
+        await self.flush_to_redis(redis_client)
+        try:
+            flushed = await self.flush_to_db(redis_client)
+            if flushed:
+                logger.info(f"조회수 {flushed}개 단어 DB 반영 완료")
+        except Exception as e:
+            logger.error(f"조회수 DB 반영 실패: {e}")
+
+    async def _run(self, redis_client: Redis) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush(redis_client)
+
+    def start(self, redis_client: Redis) -> None:
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run(redis_client))
+
+    async def stop(self, redis_client: Redis) -> None:
+        """주기 작업을 멈추고 남은 조회수를 반영합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush(redis_client)
+
+
+search_counter = SearchCounter(settings.SEARCH_COUNT_FLUSH_INTERVAL)
@@ -0,0 +1,235 @@
+import asyncio
+import logging
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+
+from app.core.cache import LocalCache
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.jargon import Jargon
+
+logger = logging.getLogger(__name__)
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_COMPAT_JAMO_FIRST = "\u3131"
+_COMPAT_JAMO_LAST = "\u318e"
+_INITIALS = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_MEDIALS = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_FINALS = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+           "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+
+_IGNORED_CHARS = re.compile(r"[\s\W_]+", re.UNICODE)
+_REPEATED_CHARS = re.compile(r"(.)\1{2,}")
+
+
+def canonical_key(word: str) -> str:
+    """
+    표기 차이를 없앤 정규화 키를 만듭니다.
+    NFKC 정규화(NFC/NFD, 전각 문자), 대소문자, 공백/문장부호를 통일하고
+    3번 이상 반복되는 글자는 2번으로 줄입니다. (ㅋㅋㅋㅋ → ㅋㅋ)
+    """
+    word = unicodedata.normalize("NFC", word)
+    # 호환용 자모(ㅋ, ㅎ 등)는 NFKC에서 조합용 자모로 바뀌므로 그대로 둡니다.
+    word = "".join(
+        char if _COMPAT_JAMO_FIRST <= char <= _COMPAT_JAMO_LAST else unicodedata.normalize("NFKC", char)
+        for char in word
+    ).lower()
+    word = _IGNORED_CHARS.sub("", word)
+    return _REPEATED_CHARS.sub(r"\1\1", word)
+
+
+def decompose_jamo(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 분해합니다. 자모 단위 오타를 비교하기 위해 사용합니다."""
+    result = []
+    for char in text:
+        code = ord(char)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            offset = code - _HANGUL_BASE
+            result.append(_INITIALS[offset // 588])
+            result.append(_MEDIALS[(offset % 588) // 28])
+            result.append(_FINALS[offset % 28])
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def levenshtein(a: str, b: str) -> int:
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        previous = current
+    return previous[-1]
+
+
+class NGramIndex:
+    """
+    길이별 bigram 역색인. 편집 거리를 계산하기 전에 길이 차이와 공유 bigram 수로 후보를 줄입니다.
+    편집 한 번으로 깨지는 bigram은 최대 2개이므로, 거리가 d 이내인 키는
+    검색 키의 서로 다른 bigram 중 최소 (개수 - 2d)개를 가지고 있습니다.
+    """
+
+    def __init__(self):
+        self._postings: Dict[Tuple[str, int], List[str]] = defaultdict(list)
+
+    @staticmethod
+    def _grams(key: str) -> Set[str]:
+        return {key[i:i + 2] for i in range(len(key) - 1)} or {key}
+
+    def add(self, key: str) -> None:
+        for gram in self._grams(key):
+            self._postings[(gram, len(key))].append(key)
+
+    def search(self, key: str, max_distance: int) -> List[Tuple[int, str]]:
+        """max_distance 이내의 키를 (거리, 키) 목록으로 가까운 순서대로 반환합니다."""
+        grams = self._grams(key)
+        required = max(len(grams) - 2 * max_distance, 1)
+        shared: Counter = Counter()
+        for length in range(len(key) - max_distance, len(key) + max_distance + 1):
+            for gram in grams:
+                shared.update(self._postings.get((gram, length), ()))
+
+        matches = []
+        for candidate, count in shared.items():
+            if count >= required:
+                distance = levenshtein(key, candidate)
+                if distance <= max_distance:
+                    matches.append((distance, candidate))
+        matches.sort()
+        return matches
+
+
+def _max_distance(jamo_key: str) -> int:
+    """짧은 단어일수록 허용하는 편집 거리를 줄여 다른 단어로 잘못 연결되는 것을 막습니다."""
+    if len(jamo_key) <= 6:
+        return 0
+    if len(jamo_key) <= 12:
+        return 1
+    return 2
+
+
+class FuzzyTable:
+    """정규화 키와 자모 키로 기존 단어를 찾는 색인 본체"""
+
+    def __init__(self):
+        self._words: Set[str] = set()
+        self._by_key: Dict[str, str] = {}
+        self._by_jamo: Dict[str, str] = {}
+        self._grams = NGramIndex()
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> "FuzzyTable":
+        table = cls()
+        for word in words:
+            table.add(word)
+        return table
+
+    def add(self, word: str) -> None:
+        if word in self._words:
+            return
+        self._words.add(word)
+        key = canonical_key(word)
+        if not key:
+            return
+        self._by_key.setdefault(key, word)
+        jamo_key = decompose_jamo(key)
+        if jamo_key not in self._by_jamo:
+            self._by_jamo[jamo_key] = word
+            self._grams.add(jamo_key)
+
+    def find(self, word: str) -> Optional[str]:
+        if word in self._words:
+            return None
+        key = canonical_key(word)
+        if not key:
+            return None
+
+        canonical = self._by_key.get(key)
+        if canonical is None:
+            jamo_key = decompose_jamo(key)
+            max_distance = _max_distance(jamo_key)
+            # 거리 0은 정규화 키가 같은 경우이므로 위에서 이미 확인했습니다.
+            if max_distance:
+                matches = self._grams.search(jamo_key, max_distance)
+                if matches:
+                    canonical = self._by_jamo[matches[0][1]]
+        return canonical
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+
+class FuzzyIndex:
+    """
+    Jargon.word에 대한 표기 변형/오타 색인.
+    정규화 키가 같거나 자모 단위 편집 거리가 가까운 단어를 기존 항목(canonical)으로 연결합니다.
+    전체 색인은 시작할 때 스레드에서 만든 뒤 교체하며, 그 전에는 이후 저장된 단어만 찾습니다.
+    """
+
+    def __init__(self, alias_maxsize: int, alias_ttl: float):
+        self._table = FuzzyTable()
+        # canonical 단어별로 연결된 변형 (프로세스 내 캐시 무효화용이므로 같은 TTL만 보관)
+        self._aliases = LocalCache(alias_maxsize, alias_ttl)
+        # 색인을 만드는 동안 추가된 단어 (만든 뒤 새 색인에 다시 추가)
+        self._pending: Optional[List[str]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def load(self) -> None:
+        """DB의 모든 단어로 색인을 만들어 교체합니다."""
+        self._pending = []
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.stream_scalars(select(Jargon.word))
+                words = [word async for word in result]
+            table = await asyncio.to_thread(FuzzyTable.from_words, words)
+            for word in self._pending:
+                table.add(word)
+            self._table = table
+            logger.info(f"유사어 색인 로드 완료: {len(table)}개 단어")
+        except Exception as e:
+            logger.error(f"유사어 색인 로드 실패: {e}")
+        finally:
+            self._pending = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.ensure_future(self.load())
+
+    def add(self, word: str) -> None:
+        self._table.add(word)
+        if self._pending is not None:
+            self._pending.append(word)
+
+    def add_words(self, words: Iterable[str]) -> None:
+        for word in words:
+            self.add(word)
+
+    def find(self, word: str) -> Optional[str]:
+        """word와 같은 항목으로 볼 수 있는 기존 단어를 반환합니다. 없거나 word 자신이면 None을 반환합니다."""
+        canonical = self._table.find(word)
+        if canonical is not None:
+            aliases = self._aliases.get(canonical) or set()
+            aliases.add(word)
+            self._aliases.set(canonical, aliases)
+        return canonical
+
+    def aliases_of(self, word: str) -> Set[str]:
+        return self._aliases.get(word) or set()
+
+
+fuzzy_index = FuzzyIndex(
+    alias_maxsize=settings.FUZZY_ALIAS_MAXSIZE,
+    alias_ttl=settings.LOCAL_CACHE_TTL
+)
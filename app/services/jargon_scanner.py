@@ -0,0 +1,163 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.jargon import Jargon
+
+logger = logging.getLogger(__name__)
+
+Match = Tuple[int, int, str]
+
+
+class AhoCorasick:
+    """
+    여러 단어를 텍스트에서 한 번의 선형 탐색으로 찾는 Aho–Corasick 오토마톤.
+    단어 추가는 트라이에 즉시 반영하고, 실패 링크는 build() 또는 다음 탐색 전에 한 번만 다시 계산합니다.
+    """
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> "AhoCorasick":
+        """단어 목록으로 실패 링크까지 계산된 오토마톤을 만듭니다."""
+        automaton = cls()
+        for word in words:
+            automaton.add(word)
+        automaton.build()
+        return automaton
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._word: List[Optional[str]] = [None]
+        # 실패 링크를 따라가며 만나는 가장 가까운 단어 끝 노드
+        self._dict_link: List[int] = [0]
+        self._dirty = False
+        self._size = 0
+
+    def add(self, word: str) -> bool:
+        """단어를 추가합니다. 새로 추가된 경우 True를 반환합니다."""
+        if not word:
+            return False
+
+        node = 0
+        for char in word:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._word.append(None)
+                self._dict_link.append(0)
+                self._goto[node][char] = next_node
+            node = next_node
+
+        if self._word[node] is not None:
+            return False
+        self._word[node] = word
+        self._size += 1
+        self._dirty = True
+        return True
+
+    def build(self) -> None:
+        """BFS로 실패 링크와 출력 링크를 계산합니다."""
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            self._dict_link[child] = 0
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[child] = fail
+                self._dict_link[child] = fail if self._word[fail] is not None else self._dict_link[fail]
+                queue.append(child)
+
+        self._dirty = False
+
+    def search(self, text: str) -> List[Match]:
+        """텍스트에서 모든 단어 출현 위치를 (시작, 끝, 단어) 목록으로 반환합니다."""
+        if self._dirty:
+            self.build()
+
+        matches: List[Match] = []
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+
+            output = node if self._word[node] is not None else self._dict_link[node]
+            while output:
+                word = self._word[output]
+                matches.append((index + 1 - len(word), index + 1, word))
+                output = self._dict_link[output]
+
+        matches.sort()
+        return matches
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class JargonScanner:
+    """
+    Jargon 테이블의 단어로 만든 오토마톤을 관리합니다.
+    오토마톤은 스레드에서 통째로 만든 뒤 교체하므로, 새 단어가 추가되어도 탐색은
+    새 오토마톤이 준비될 때까지 기존 오토마톤을 그대로 사용합니다.
+    """
+
+    def __init__(self):
+        self._automaton = AhoCorasick()
+        self._words: Set[str] = set()
+        self._loaded = False
+        self._lock = asyncio.Lock()
+        self._rebuild_task: Optional[asyncio.Task] = None
+
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        """처음 사용할 때 DB의 모든 단어로 오토마톤을 구성합니다."""
+        if self._loaded:
+            return
+        async with self._lock:
+            if self._loaded:
+                return
+            result = await db.stream_scalars(select(Jargon.word))
+            self._words.update([word async for word in result])
+            self._automaton = await asyncio.to_thread(AhoCorasick.from_words, list(self._words))
+            self._loaded = True
+            logger.info(f"신조어 스캐너 로드 완료: {len(self._automaton)}개 단어")
+
+    def add_words(self, words: Iterable[str]) -> None:
+        """새로 저장된 단어를 추가하고 오토마톤을 백그라운드에서 다시 만들도록 예약합니다."""
+        added = [word for word in dict.fromkeys(words) if word and word not in self._words]
+        if not added:
+            return
+        self._words.update(added)
+        # 로드 전이라면 ensure_loaded가 DB에서 함께 읽습니다.
+        if self._loaded and (self._rebuild_task is None or self._rebuild_task.done()):
+            self._rebuild_task = asyncio.ensure_future(self._rebuild())
+
+    async def _rebuild(self) -> None:
+        # 만드는 동안 추가된 단어가 있으면 한 번 더 만듭니다.
+        while len(self._automaton) != len(self._words):
+            words = list(self._words)
+            try:
+                self._automaton = await asyncio.to_thread(AhoCorasick.from_words, words)
+            except Exception as e:
+                logger.error(f"신조어 스캐너 재구성 실패: {e}")
+                return
+            logger.info(f"신조어 스캐너 재구성 완료: {len(words)}개 단어")
+
+    async def scan(self, text: str, db: AsyncSession) -> List[Match]:
+        await self.ensure_loaded(db)
+        return self._automaton.search(text)
+
+
+jargon_scanner = JargonScanner()
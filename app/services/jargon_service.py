@@ -1,65 +1,680 @@
-""" import json
+import asyncio
+import gzip
+import logging
+import time
+import unicodedata
+import uuid
+from typing import Any, AsyncIterator, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+import orjson
+import redis
+from prometheus_client import REGISTRY
+from redis.asyncio import Redis
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
-import aioredis
-
-from app import models, schemas
-from .ai_service import interpret_with_llm
-
-async def get_interpretation(term: str, db: AsyncSession, redis: aioredis.Redis):
-    # 1. Redis 캐시 확인
-    cached_interpretation = await redis.get(f"jargon:{term}")
-    if cached_interpretation:
-        return json.loads(cached_interpretation)
-
-    # 2. DB 확인
-    result = await db.execute(
-        select(models.Jargon)
-        .options(selectinload(models.Jargon.interpretations))
-        .filter(models.Jargon.term == term)
-    )
-    jargon = result.scalar_one_or_none()
-
-    if jargon and jargon.interpretations:
-        interpretation = jargon.interpretations[0] # 가장 최신 해석을 가져온다고 가정
-        response = schemas.JargonInterpretationResponse(
-            term=jargon.term,
-            meaning=interpretation.meaning,
-            example=interpretation.example
-        )
-        # DB 결과를 캐시에 저장
-        await redis.set(f"jargon:{term}", response.model_dump_json(), ex=3600) # 1시간
-        return response
 
-    # 3. GPT API 호출
-    new_interpretation_data = await interpret_with_llm(term)
-    if not new_interpretation_data:
+from app.core.cache import LocalCache, TierStats
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, get_redis_binary
+from app.core.invalidation import InvalidationBus
+from app.core.metrics import TierStatsCollector, stage
+from app.core.singleflight import SingleFlight
+from app.models.jargon import Jargon
+from app.schemas.jargon_schema import JargonResponse
+from app.services.ai_service import AIService, ai_service
+from app.services.batch_scheduler import llm_batcher
+from app.services.counter_service import search_counter
+from app.services.autocomplete import autocomplete
+from app.services.fuzzy_index import fuzzy_index
+from app.services.jargon_scanner import jargon_scanner
+from app.services.llm_client import TokenBudgetExceededError, llm_client
+from app.services.negative_cache import negative_cache
+from app.services.prompt_cache import prompt_cache
+from app.services.snapshot_service import dictionary_snapshot
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 내 캐시 (Redis 앞단 계층)
+local_cache = LocalCache(settings.LOCAL_CACHE_MAXSIZE, settings.LOCAL_CACHE_TTL)
+
+# 워커 간 캐시 무효화 채널
+INVALIDATION_CHANNEL = "jargon:invalidate"
+
+
+def _evict_local(words: Iterable[str]) -> None:
+    """프로세스 내 캐시에서 단어와 그 표기 변형을 삭제합니다."""
+    words = list(words)
+    for word in words:
+        local_cache.delete(word)
+        for alias in fuzzy_index.aliases_of(word):
+            local_cache.delete(alias)
+    negative_cache.evict_local(words)
+
+
+def _reset_local() -> None:
+    local_cache.clear()
+    negative_cache.clear_local()
+
+
+# 다른 워커가 수정한 단어를 프로세스 내 캐시에서 삭제
+invalidation_bus = InvalidationBus(
+    INVALIDATION_CHANNEL, on_invalidate=_evict_local, on_reset=_reset_local
+)
+
+# 계층별 hit/miss 카운터
+lookup_stats = TierStats("local", "redis", "negative", "db", "fuzzy", "llm")
+REGISTRY.register(TierStatsCollector("jargon_cache", lookup_stats))
+
+# 프로세스 내 LLM 호출 병합
+llm_flight = SingleFlight()
+
+# 같은 분석 요청(프롬프트 캐시 키)의 병합
+analysis_flight = SingleFlight()
+
+# 응답 이후에도 진행되는 백그라운드 LLM 조회 (GC 방지용 참조)
+_background_tasks: Set[asyncio.Task] = set()
+
+# lease 소유자만 삭제할 수 있도록 토큰을 비교한 뒤 삭제합니다.
+_RELEASE_LEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def normalize_word(word: str) -> str:
+    """조회 키로 사용할 수 있도록 단어를 정규화합니다."""
+    return unicodedata.normalize("NFC", word).strip()
+
+
+def cache_key(word: str) -> str:
+    """Redis 캐시 키를 반환합니다."""
+    return f"jargon:{word}"
+
+
+def lease_key(word: str) -> str:
+    """워커 간 LLM 호출 lease 키를 반환합니다."""
+    return f"jargon:lease:{word}"
+
+
+def flight_result_key(word: str) -> str:
+    """lease 소유자가 다른 워커에게 결과를 전달하는 키를 반환합니다."""
+    return f"jargon:flight:{word}"
+
+
+def serialize_jargon(jargon: Jargon) -> Dict[str, Any]:
+    """ORM 객체를 캐시/응답에 사용하는 dict로 변환합니다."""
+    return JargonResponse.model_validate(jargon).model_dump(mode="json")
+
+
+class CachedJargon(NamedTuple):
+    """
+    캐시에 보관하는 직렬화된 응답 본문.
+    조회 시 모델 검증과 JSON 인코딩 없이 body를 그대로 응답합니다.
+    word는 조회수를 집계할 단어이며, 정보 없음 결과이면 None입니다.
+    """
+    word: Optional[str]
+    body: bytes
+
+
+def encode_payload(payload: Dict[str, Any]) -> CachedJargon:
+    word = None if AIService.is_not_found(payload) else payload["word"]
+    return CachedJargon(word, orjson.dumps(payload))
+
+
+def encode_jargon(jargon: Jargon) -> CachedJargon:
+    return CachedJargon(jargon.word, orjson.dumps(serialize_jargon(jargon)))
+
+
+def encode_batch(results: Dict[str, CachedJargon], pending: List[str]) -> bytes:
+    """일괄 조회 응답({"results": ..., "pending": ...})을 캐시된 본문을 이어 붙여 만듭니다."""
+    items = b",".join(orjson.dumps(word) + b":" + entry.body for word, entry in results.items())
+    return b'{"results":{' + items + b'},"pending":' + orjson.dumps(pending) + b"}"
+
+
+def _compress(body: bytes) -> bytes:
+    """크기가 큰 본문만 gzip으로 압축해 Redis에 저장합니다."""
+    if len(body) < settings.CACHE_COMPRESS_MIN_BYTES:
+        return body
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+def _decompress(value: bytes) -> bytes:
+    if value[:2] == b"\x1f\x8b":
+        return gzip.decompress(value)
+    return value
+
+
+async def _redis_get(word: str) -> Optional[CachedJargon]:
+    try:
+        cached = await get_redis_binary().get(cache_key(word))
+    except redis.RedisError as e:
+        logger.warning(f"Redis 조회 실패 ({word}): {e}")
         return None
+    # Redis에는 DB에 저장된 단어만 기록하므로 word가 조회수 집계 대상입니다.
+    return CachedJargon(word, _decompress(cached)) if cached else None
+
+
+async def _redis_set(word: str, entry: CachedJargon) -> None:
+    try:
+        await get_redis_binary().setex(
+            cache_key(word),
+            settings.REDIS_CACHE_TTL,
+            _compress(entry.body)
+        )
+    except redis.RedisError as e:
+        logger.warning(f"Redis 저장 실패 ({word}): {e}")
 
-    # 4. 새 데이터를 DB에 저장
-    if not jargon:
-        jargon = models.Jargon(term=term)
-        db.add(jargon)
-        await db.flush() # jargon.id를 얻기 위해 flush
-    
-    new_interpretation = models.Interpretation(
-        jargon_id=jargon.id,
-        **new_interpretation_data
+
+async def _save_analysis(db: AsyncSession, result: Dict[str, Any]) -> Jargon:
+    """LLM 분석 결과를 DB에 저장합니다. 동시에 저장된 경우 기존 행을 반환합니다."""
+    jargon = Jargon(
+        word=result["word"],
+        explanation=result["explanation"],
+        source=result.get("source", "알 수 없음")
     )
-    db.add(new_interpretation)
+    db.add(jargon)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        existing = await db.execute(select(Jargon).where(Jargon.word == result["word"]))
+        return existing.scalar_one()
+    await db.refresh(jargon)
+    return jargon
+
+
+async def on_jargons_saved(redis_client: Redis, jargons: Iterable[Jargon]) -> None:
+    """저장(생성/수정)된 신조어를 파생 인덱스와 사전 스냅샷에 반영합니다."""
+    words = [jargon.word for jargon in jargons]
+    jargon_scanner.add_words(words)
+    fuzzy_index.add_words(words)
+    autocomplete.add_words(words)
+    await negative_cache.remove(redis_client, words)
+    await dictionary_snapshot.record_changes(redis_client, words)
+
+
+async def upsert_jargons(db: AsyncSession, results: Iterable[Dict[str, Any]]) -> List[Jargon]:
+    """
+    분석 결과를 INSERT ... ON CONFLICT (word) DO UPDATE 한 번으로 일괄 저장합니다.
+    사용자가 수정한 항목은 덮어쓰지 않으며, 저장(또는 갱신)된 행만 반환합니다.
+    """
+    rows: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        if not result.get("word") or not result.get("explanation"):
+            continue
+        word = normalize_word(result["word"])
+        rows[word] = {
+            "word": word,
+            "explanation": result["explanation"],
+            "source": result.get("source") or "알 수 없음"
+        }
+    if not rows:
+        return []
+
+    dialect = sqlite if db.bind.dialect.name == "sqlite" else postgresql
+    stmt = dialect.insert(Jargon).values(list(rows.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Jargon.word],
+        set_={
+            "explanation": stmt.excluded.explanation,
+            "source": stmt.excluded.source,
+            "updated_at": func.now()
+        },
+        where=Jargon.is_user_modified.is_not(True)
+    ).returning(Jargon)
+
+    result = await db.scalars(stmt, execution_options={"populate_existing": True})
+    jargons = list(result)
     await db.commit()
+    return jargons
+
+
+async def store_analysis(
+    db: AsyncSession,
+    redis_client: Redis,
+    results: Iterable[Dict[str, Any]]
+) -> List[Jargon]:
+    """LLM 분석 결과를 DB에 일괄 저장하고 파생 인덱스와 캐시에 반영합니다."""
+    jargons = await upsert_jargons(db, results)
+    await on_jargons_saved(redis_client, jargons)
+    await cache_jargons(jargons)
+    # 다른 워커의 프로세스 내 캐시에 남은 이전 설명을 삭제
+    await invalidation_bus.publish(redis_client, [jargon.word for jargon in jargons])
+    return jargons
+
+
+async def analyze_words(
+    words: Iterable[str],
+    context: Optional[str],
+    redis_client: Redis
+) -> List[Dict[str, Any]]:
+    """
+    여러 신조어를 분석합니다.
+    같은 단어 목록·컨텍스트·모델 설정의 분석은 프롬프트 캐시의 응답 원문을 재사용하고,
+    동시에 들어온 같은 분석은 한 번의 LLM 호출로 합칩니다.
+    컨텍스트가 있는 분석 결과는 단어별 캐시와 DB에 저장하지 않습니다.
+    """
+    words = list(dict.fromkeys(w for w in map(normalize_word, words) if w))
+    key = prompt_cache.key(words, context)
+
+    completion = await prompt_cache.get(redis_client, key)
+    if completion is not None:
+        return ai_service.parse_completion(completion, words)
+
+    llm_client.check_budget()
+
+    async def run() -> List[Dict[str, Any]]:
+        results, completion = await ai_service.analyze_jargon_raw(words, context)
+        await prompt_cache.set(redis_client, key, completion)
+        if not context:
+            async with AsyncSessionLocal() as db:
+                await store_analysis(db, redis_client, results)
+        return results
 
-    response = schemas.JargonInterpretationResponse(
-        term=term, **new_interpretation_data
+    return await analysis_flight.do(key, run)
+
+
+async def cache_jargons(jargons: Iterable[Jargon]) -> Dict[str, CachedJargon]:
+    """
+    저장된 행들을 직렬화해 한 번의 파이프라인으로 Redis와 프로세스 내 캐시에 기록하고,
+    직렬화된 항목을 반환합니다.
+    """
+    entries = {jargon.word: encode_jargon(jargon) for jargon in jargons}
+    if not entries:
+        return entries
+
+    for word, entry in entries.items():
+        local_cache.set(word, entry)
+    try:
+        async with get_redis_binary().pipeline(transaction=False) as pipe:
+            for word, entry in entries.items():
+                pipe.setex(cache_key(word), settings.REDIS_CACHE_TTL, _compress(entry.body))
+            await pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Redis 일괄 저장 실패 ({len(entries)}개): {e}")
+    return entries
+
+
+async def get_interpretation(
+    word: str,
+    db: AsyncSession,
+    redis_client: Redis
+) -> CachedJargon:
+    """
+    신조어 정보를 계층적으로 조회합니다.
+    프로세스 내 캐시 → Redis → PostgreSQL → GPT API 순서로 조회하고,
+    하위 계층에서 찾은 결과는 상위 계층에 모두 다시 기록합니다.
+    결과는 응답 본문으로 바로 쓸 수 있도록 직렬화된 JSON 바이트로 반환합니다.
+    """
+    word = normalize_word(word)
+    entry = await _lookup(word, db, redis_client)
+    if entry.word is not None:
+        search_counter.increment(entry.word)
+    return entry
+
+
+async def _lookup(word: str, db: AsyncSession, redis_client: Redis) -> CachedJargon:
+    # 1. 프로세스 내 캐시 확인
+    entry = local_cache.get(word)
+    if entry is not None:
+        lookup_stats.hit("local")
+        return entry
+    lookup_stats.miss("local")
+
+    # 2. Redis 캐시 확인
+    with stage("redis"):
+        entry = await _redis_get(word)
+    if entry is not None:
+        lookup_stats.hit("redis")
+        local_cache.set(word, entry)
+        return entry
+    lookup_stats.miss("redis")
+
+    # 3. 최근 LLM도 설명하지 못한 단어는 DB/LLM 조회를 건너뜀
+    if await negative_cache.contains(redis_client, word):
+        lookup_stats.hit("negative")
+        return encode_payload(AIService.not_found_result(word))
+    lookup_stats.miss("negative")
+
+    # 4. DB 확인
+    with stage("db"):
+        result = await db.execute(select(Jargon).where(Jargon.word == word))
+        jargon = result.scalar_one_or_none()
+    if jargon:
+        lookup_stats.hit("db")
+        entry = encode_jargon(jargon)
+        await _redis_set(word, entry)
+        local_cache.set(word, entry)
+        return entry
+    lookup_stats.miss("db")
+
+    # 5. 표기 변형/오타인 경우 기존 항목으로 연결
+    with stage("fuzzy"):
+        canonical = fuzzy_index.find(word)
+    if canonical is not None:
+        lookup_stats.hit("fuzzy")
+        entry = await _lookup(canonical, db, redis_client)
+        local_cache.set(word, entry)
+        return entry
+    lookup_stats.miss("fuzzy")
+
+    # 6. GPT API 호출 (동시 요청은 하나의 호출로 병합, 예산은 병합에 참여하는 요청마다 확인)
+    llm_client.check_budget()
+    with stage("llm_lookup"):
+        return await llm_flight.do(word, lambda: _fetch_from_llm(word, redis_client))
+
+
+async def get_interpretations(
+    words: Iterable[str],
+    db: AsyncSession,
+    redis_client: Redis
+) -> Tuple[Dict[str, CachedJargon], List[str]]:
+    """
+    여러 신조어를 한 번에 조회합니다.
+    프로세스 내 캐시 → Redis MGET → 정보 없음 캐시 → DB IN 쿼리 순으로 조회하고,
+    남은 단어는 백그라운드 LLM 분석을 예약한 뒤 pending으로 반환합니다.
+    """
+    remaining = list(dict.fromkeys(w for w in map(normalize_word, words) if w))
+    results: Dict[str, CachedJargon] = {}
+
+    # 1. 프로세스 내 캐시 확인
+    misses = []
+    for word in remaining:
+        entry = local_cache.get(word)
+        if entry is not None:
+            lookup_stats.hit("local")
+            results[word] = entry
+        else:
+            lookup_stats.miss("local")
+            misses.append(word)
+    remaining = misses
+
+    # 2. Redis MGET
+    if remaining:
+        try:
+            with stage("redis"):
+                cached = await get_redis_binary().mget([cache_key(word) for word in remaining])
+        except redis.RedisError as e:
+            logger.warning(f"Redis 일괄 조회 실패 ({len(remaining)}개): {e}")
+            cached = [None] * len(remaining)
+
+        misses = []
+        for word, value in zip(remaining, cached):
+            if value:
+                lookup_stats.hit("redis")
+                results[word] = CachedJargon(word, _decompress(value))
+                local_cache.set(word, results[word])
+            else:
+                lookup_stats.miss("redis")
+                misses.append(word)
+        remaining = misses
+
+    # 3. 최근 LLM도 설명하지 못한 단어는 DB/LLM 조회를 건너뜀
+    if remaining:
+        unknown = await negative_cache.contains_many(redis_client, remaining)
+        misses = []
+        for word in remaining:
+            if word in unknown:
+                lookup_stats.hit("negative")
+                results[word] = encode_payload(AIService.not_found_result(word))
+            else:
+                lookup_stats.miss("negative")
+                misses.append(word)
+        remaining = misses
+
+    # 4. DB IN 쿼리
+    if remaining:
+        with stage("db"):
+            rows = await db.scalars(select(Jargon).where(Jargon.word.in_(remaining)))
+            jargons = list(rows)
+        results.update(await cache_jargons(jargons))
+
+        misses = []
+        for word in remaining:
+            if word in results:
+                lookup_stats.hit("db")
+            else:
+                lookup_stats.miss("db")
+                misses.append(word)
+        remaining = misses
+
+    # 5. 표기 변형/오타는 기존 항목으로 연결
+    # (단어당 검색 비용이 있으므로 요청당 FUZZY_BATCH_MAX_WORDS개까지만, 나머지는 바로 LLM 분석)
+    if remaining:
+        aliases = {}
+        misses = remaining[settings.FUZZY_BATCH_MAX_WORDS:]
+        with stage("fuzzy"):
+            for word in remaining[:settings.FUZZY_BATCH_MAX_WORDS]:
+                canonical = fuzzy_index.find(word)
+                if canonical is not None:
+                    lookup_stats.hit("fuzzy")
+                    aliases[word] = canonical
+                else:
+                    lookup_stats.miss("fuzzy")
+                    misses.append(word)
+        remaining = misses
+
+        canonicals = {}
+        for canonical in set(aliases.values()):
+            entry = results.get(canonical) or local_cache.get(canonical)
+            if entry is not None:
+                canonicals[canonical] = entry
+        unresolved = [canonical for canonical in set(aliases.values()) if canonical not in canonicals]
+        if unresolved:
+            rows = await db.scalars(select(Jargon).where(Jargon.word.in_(unresolved)))
+            for jargon in rows:
+                canonicals[jargon.word] = encode_jargon(jargon)
+
+        for word, canonical in aliases.items():
+            if canonical in canonicals:
+                results[word] = canonicals[canonical]
+                local_cache.set(word, canonicals[canonical])
+            else:
+                remaining.append(word)
+
+    for entry in results.values():
+        if entry.word is not None:
+            search_counter.increment(entry.word)
+
+    # 6. 남은 단어는 백그라운드에서 LLM 분석 (단일 조회와 같은 병합 경로 사용)
+    # 일일 LLM 예산을 다 쓴 클라이언트의 단어는 분석을 예약하지 않습니다.
+    try:
+        llm_client.check_budget()
+    except TokenBudgetExceededError:
+        return results, remaining
+    for word in remaining:
+        task = asyncio.ensure_future(
+            llm_flight.do(word, lambda word=word: _fetch_from_llm(word, redis_client))
+        )
+        _background_tasks.add(task)
+        task.add_done_callback(_finish_background_task)
+
+    return results, remaining
+
+
+def _finish_background_task(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.error(f"백그라운드 LLM 조회 실패: {task.exception()}")
+
+
+async def _fetch_from_llm(word: str, redis_client: Redis) -> CachedJargon:
+    """
+    워커 간 Redis lease를 잡은 경우에만 LLM을 호출합니다.
+    다른 워커가 lease를 가지고 있으면 그 결과를 기다립니다.
+    """
+    token = uuid.uuid4().hex
+    try:
+        acquired = await redis_client.set(
+            lease_key(word), token, nx=True, ex=settings.LLM_LEASE_TTL
+        )
+    except redis.RedisError as e:
+        logger.warning(f"LLM lease 획득 실패 ({word}): {e}")
+        acquired = True
+        token = None
+
+    if not acquired:
+        entry = await _wait_for_flight(word, redis_client)
+        if entry is not None:
+            return entry
+
+    try:
+        return await _analyze_and_store(word, redis_client)
+    finally:
+        if token is not None:
+            try:
+                await redis_client.eval(_RELEASE_LEASE_SCRIPT, 1, lease_key(word), token)
+            except redis.RedisError as e:
+                logger.warning(f"LLM lease 해제 실패 ({word}): {e}")
+
+
+async def _wait_for_flight(word: str, redis_client: Redis) -> Optional[CachedJargon]:
+    """다른 워커의 LLM 결과를 lease가 끝날 때까지 기다립니다."""
+    deadline = time.monotonic() + settings.LLM_LEASE_TTL
+    while time.monotonic() < deadline:
+        await asyncio.sleep(settings.LLM_LEASE_POLL_INTERVAL)
+        try:
+            cached = await redis_client.get(flight_result_key(word))
+            if cached:
+                return encode_payload(orjson.loads(cached))
+            if not await redis_client.exists(lease_key(word)):
+                break
+        except redis.RedisError as e:
+            logger.warning(f"LLM 결과 대기 중 Redis 오류 ({word}): {e}")
+            break
+    return None
+
+
+async def _analyze_and_store(word: str, redis_client: Redis) -> CachedJargon:
+    """LLM으로 단어를 분석하고 결과를 DB와 캐시에 기록합니다."""
+    if settings.OPENAI_API_KEY:
+        # 다른 요청의 단어들과 묶어 하나의 프롬프트로 전송
+        result = await llm_batcher.submit(word)
+    else:
+        result = await ai_service.get_single_word_analysis(word)
+    if AIService.is_not_found(result):
+        lookup_stats.miss("llm")
+        entry = encode_payload(result)
+        await negative_cache.add(redis_client, word)
+    else:
+        lookup_stats.hit("llm")
+        result["word"] = word
+        async with AsyncSessionLocal() as db:
+            jargon = await _save_analysis(db, result)
+        entry = encode_jargon(jargon)
+        await on_jargons_saved(redis_client, [jargon])
+        await _redis_set(word, entry)
+        local_cache.set(word, entry)
+
+    # lease를 기다리는 다른 워커에게 결과 전달
+    try:
+        await redis_client.setex(
+            flight_result_key(word),
+            settings.LLM_LEASE_TTL,
+            entry.body.decode("utf-8")
+        )
+    except redis.RedisError as e:
+        logger.warning(f"LLM 결과 공유 실패 ({word}): {e}")
+    return entry
+
+
+async def find_jargons(db: AsyncSession, words: Iterable[str]) -> List[Dict[str, Any]]:
+    """DB에 저장된 신조어만 한 번의 IN 쿼리로 조회합니다."""
+    words = list(dict.fromkeys(map(normalize_word, words)))
+    if not words:
+        return []
+    result = await db.scalars(select(Jargon).where(Jargon.word.in_(words)))
+    return [serialize_jargon(jargon) for jargon in result]
+
+
+async def list_jargons(
+    db: AsyncSession,
+    limit: int,
+    after_id: Optional[int] = None,
+    skip: int = 0
+) -> List[Jargon]:
+    """
+    id 순서로 신조어 목록을 조회합니다.
+    after_id가 주어지면 keyset 방식(id > after_id)으로 조회해 OFFSET 스캔을 피합니다.
+    """
+    stmt = select(Jargon).order_by(Jargon.id).limit(limit)
+    if after_id is not None:
+        stmt = stmt.where(Jargon.id > after_id)
+    elif skip:
+        stmt = stmt.offset(skip)
+    result = await db.scalars(stmt)
+    return list(result)
+
+
+async def search_jargons(db: AsyncSession, query: str, limit: int) -> List[Jargon]:
+    """
+    단어 또는 설명에 query가 포함된 신조어를 조회합니다.
+    단어가 query로 시작하는 항목을 먼저, 그 안에서는 조회수가 높은 순으로 정렬합니다.
+    PostgreSQL에서는 pg_trgm GIN 인덱스로 부분 일치를 찾습니다.
+    """
+    query = unicodedata.normalize("NFC", query.strip())
+    stmt = (
+        select(Jargon)
+        .where(
+            Jargon.word.icontains(query, autoescape=True)
+            | Jargon.explanation.icontains(query, autoescape=True)
+        )
+        .order_by(
+            Jargon.word.istartswith(query, autoescape=True).desc(),
+            Jargon.search_count.desc(),
+            Jargon.id
+        )
+        .limit(limit)
     )
-    # 새 결과를 캐시에 저장
-    await redis.set(f"jargon:{term}", response.model_dump_json(), ex=3600)
-    
-    return response
+    with stage("db"):
+        result = await db.scalars(stmt)
+    return list(result)
+
+
+def _row_to_json(row) -> bytes:
+    return orjson.dumps(dict(row._mapping))
+
+
+async def export_ndjson(batch_size: int = 1000) -> AsyncIterator[bytes]:
+    """
+    전체 신조어를 NDJSON으로 스트리밍합니다.
+    서버 측 커서와 yield_per로 읽어 메모리 사용량이 테이블 크기와 무관하게 유지됩니다.
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(
+            select(*Jargon.__table__.columns)
+            .order_by(Jargon.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for rows in result.partitions():
+            yield b"".join(_row_to_json(row) + b"\n" for row in rows)
+
+
+async def invalidate(word: str, redis_client: Redis) -> None:
+    """단어의 캐시를 모든 계층과 모든 워커에서 삭제합니다."""
+    word = normalize_word(word)
+    _evict_local([word])
+    try:
+        await redis_client.delete(cache_key(word))
+    except redis.RedisError as e:
+        logger.warning(f"Redis 캐시 삭제 실패 ({word}): {e}")
+    await invalidation_bus.publish(redis_client, [word])
+
+
+async def forget_unknown(redis_client: Redis, word: str) -> bool:
+    """정보 없음으로 기록된 단어를 모든 워커에서 삭제합니다."""
+    word = normalize_word(word)
+    removed = await negative_cache.remove(redis_client, [word])
+    await invalidation_bus.publish(redis_client, [word])
+    return bool(removed)
 
-async def get_all_jargon_terms(db: AsyncSession):
-    result = await db.execute(select(models.Jargon.term))
-    return result.scalars().all()
 
- """
\ No newline at end of file
+async def clear_unknown(redis_client: Redis) -> int:
+    """정보 없음 캐시를 모든 워커에서 비우고 삭제한 개수를 반환합니다."""
+    count = await negative_cache.clear(redis_client)
+    await invalidation_bus.publish_reset(redis_client)
+    return count
@@ -0,0 +1,258 @@
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+import redis
+from redis.asyncio import Redis
+
+from app.core import rate_limit
+from app.core.config import settings
+from app.services import jargon_service
+from app.services.llm_client import LLMQueueTimeoutError, LLMUnavailableError, TokenBudgetExceededError
+
+logger = logging.getLogger(__name__)
+
+STREAM_KEY = "jargon:jobs"
+GROUP_NAME = "analyze-workers"
+
+
+def job_key(job_id: str) -> str:
+    return f"jargon:job:{job_id}"
+
+
+class AnalysisJobQueue:
+    """
+    Redis Streams 기반 신조어 분석 작업 큐.
+    요청은 작업 ID만 받아 바로 반환하고, 워커 코루틴들이 consumer group으로 스트림을 나누어 처리합니다.
+    처리가 끝난 작업만 XACK하므로, 워커가 중간에 죽으면 claim_idle 이후 다른 워커가 이어받습니다.
+    처리 중에는 주기적으로 XCLAIM해 idle 시간을 초기화하므로, 오래 걸리는 작업을 다른 워커가 가져가지 않습니다.
+    모든 작업의 LLM 요청은 llm_concurrency개로 제한해 대화형 조회가 쓸 동시 호출 슬롯을 남깁니다.
+    작업 상태와 결과는 jargon:job:{id} 해시에 저장합니다.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        chunk_size: int,
+        claim_idle: float,
+        max_attempts: int,
+        result_ttl: int,
+        llm_concurrency: int
+    ):
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.claim_idle = claim_idle
+        self.max_attempts = max_attempts
+        self.result_ttl = result_ttl
+        self._llm_slots = asyncio.Semaphore(llm_concurrency)
+        self._consumer_prefix = f"{socket.gethostname()}-{os.getpid()}"
+        self._tasks: List[asyncio.Task] = []
+
+    async def submit(
+        self,
+        redis_client: Redis,
+        words: List[str],
+        context: Optional[str] = None
+    ) -> str:
+        """작업을 등록하고 작업 ID를 반환합니다."""
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        job = {
+            "status": "queued",
+            "words": json.dumps(words, ensure_ascii=False),
+            "context": context or "",
+            "client": rate_limit.client_key.get() or "",
+            "attempts": 0,
+            "created_at": now,
+            "updated_at": now,
+        }
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.hset(job_key(job_id), mapping=job)
+            pipe.expire(job_key(job_id), self.result_ttl)
+            pipe.xadd(STREAM_KEY, {"job_id": job_id}, maxlen=settings.JOB_STREAM_MAXLEN, approximate=True)
+            await pipe.execute()
+        return job_id
+
+    async def get(self, redis_client: Redis, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태를 반환합니다. 작업이 없거나 만료되었으면 None을 반환합니다."""
+        job = await redis_client.hgetall(job_key(job_id))
+        if not job:
+            return None
+        return {
+            "job_id": job_id,
+            "status": job["status"],
+            "words": json.loads(job["words"]),
+            "results": json.loads(job["results"]) if job.get("results") else None,
+            "error": job.get("error") or None,
+            "attempts": int(job["attempts"]),
+            "created_at": float(job["created_at"]),
+            "updated_at": float(job["updated_at"]),
+        }
+
+    async def wait(self, redis_client: Redis, job_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """작업이 끝나거나 timeout이 지날 때까지 기다린 뒤 상태를 반환합니다."""
+        deadline = time.monotonic() + timeout
+        while True:
+            job = await self.get(redis_client, job_id)
+            if job is None or job["status"] in ("done", "failed") or time.monotonic() >= deadline:
+                return job
+            await asyncio.sleep(settings.JOB_POLL_INTERVAL)
+
+    async def _update(self, redis_client: Redis, job_id: str, **fields: Any) -> None:
+        await redis_client.hset(job_key(job_id), mapping={**fields, "updated_at": time.time()})
+
+    async def _ensure_group(self, redis_client: Redis) -> None:
+        try:
+            await redis_client.xgroup_create(STREAM_KEY, GROUP_NAME, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _next_message(self, redis_client: Redis, consumer: str):
+        """오래 처리되지 않은 작업(워커 장애)을 먼저 가져오고, 없으면 새 작업을 기다립니다."""
+        _, claimed, _ = await redis_client.xautoclaim(
+            STREAM_KEY, GROUP_NAME, consumer,
+            min_idle_time=int(self.claim_idle * 1000), start_id="0-0", count=1
+        )
+        if claimed:
+            return claimed[0]
+        response = await redis_client.xreadgroup(
+            GROUP_NAME, consumer, {STREAM_KEY: ">"}, count=1, block=settings.JOB_BLOCK_MS
+        )
+        if response:
+            return response[0][1][0]
+        return None
+
+    async def _heartbeat(self, redis_client: Redis, consumer: str, message_id: str) -> None:
+        """처리 중인 메시지의 idle 시간을 claim_idle보다 자주 초기화합니다."""
+        while True:
+            await asyncio.sleep(self.claim_idle / 3)
+            try:
+                await redis_client.xclaim(
+                    STREAM_KEY, GROUP_NAME, consumer,
+                    min_idle_time=0, message_ids=[message_id], justid=True
+                )
+            except redis.RedisError as e:
+                logger.warning(f"분석 작업 heartbeat 실패 ({message_id}): {e}")
+
+    async def _analyze_chunk(self, redis_client: Redis, words: List[str], context: Optional[str]):
+        async with self._llm_slots:
+            # 청크마다 등록한 클라이언트의 오늘 사용량을 다시 확인해, 예산을 넘기면 LLM을 호출하지 않습니다.
+            used = await rate_limit.daily_usage(redis_client, rate_limit.client_key.get())
+            rate_limit.budget_exhausted.set(used >= settings.LLM_DAILY_TOKEN_BUDGET)
+            return await jargon_service.analyze_words(words, context, redis_client)
+
+    async def _process(self, redis_client: Redis, consumer: str, message_id: str, job_id: str) -> None:
+        heartbeat = asyncio.ensure_future(self._heartbeat(redis_client, consumer, message_id))
+        try:
+            await self._run_job(redis_client, message_id, job_id)
+        finally:
+            heartbeat.cancel()
+
+    async def _run_job(self, redis_client: Redis, message_id: str, job_id: str) -> None:
+        job = await redis_client.hgetall(job_key(job_id))
+        if not job or job["status"] in ("done", "failed"):
+            await redis_client.xack(STREAM_KEY, GROUP_NAME, message_id)
+            return
+
+        attempts = await redis_client.hincrby(job_key(job_id), "attempts", 1)
+        if attempts > self.max_attempts:
+            await self._update(redis_client, job_id, status="failed", error="재시도 횟수를 초과했습니다.")
+            await redis_client.xack(STREAM_KEY, GROUP_NAME, message_id)
+            return
+
+        await self._update(redis_client, job_id, status="running")
+        # 작업을 등록한 클라이언트의 LLM 토큰 예산에서 차감합니다.
+        rate_limit.client_key.set(job.get("client") or None)
+        words = json.loads(job["words"])
+        context = job.get("context") or None
+        chunks = [words[i:i + self.chunk_size] for i in range(0, len(words), self.chunk_size)]
+
+        try:
+            chunk_results = await asyncio.gather(*(
+                self._analyze_chunk(redis_client, chunk, context) for chunk in chunks
+            ))
+        except TokenBudgetExceededError as e:
+            logger.info(f"분석 작업 {job_id} 중단 (일일 LLM 토큰 예산 소진)")
+            await self._update(redis_client, job_id, status="failed", error=str(e))
+            await redis_client.xack(STREAM_KEY, GROUP_NAME, message_id)
+            return
+        except LLMQueueTimeoutError as e:
+            # 대화형 조회가 몰려 슬롯을 얻지 못한 것은 작업의 실패가 아니므로 시도 횟수에서 뺍니다.
+            logger.warning(f"분석 작업 {job_id} 보류 (LLM 대기열 초과): {e}")
+            await redis_client.hincrby(job_key(job_id), "attempts", -1)
+            await self._update(redis_client, job_id, status="queued", error=str(e))
+            return
+        except LLMUnavailableError as e:
+            # 일시적인 장애는 ACK하지 않고 남겨 claim_idle 이후 다시 처리합니다.
+            logger.warning(f"분석 작업 {job_id} 보류 (시도 {attempts}/{self.max_attempts}): {e}")
+            await self._update(redis_client, job_id, status="queued", error=str(e))
+            return
+        except Exception as e:
+            logger.error(f"분석 작업 {job_id} 실패: {e}")
+            await self._update(redis_client, job_id, status="failed", error=str(e))
+            await redis_client.xack(STREAM_KEY, GROUP_NAME, message_id)
+            return
+
+        results = [result for chunk in chunk_results for result in chunk]
+        await self._update(
+            redis_client, job_id,
+            status="done", error="", results=json.dumps(results, ensure_ascii=False)
+        )
+        await redis_client.xack(STREAM_KEY, GROUP_NAME, message_id)
+        logger.info(f"분석 작업 {job_id} 완료: {len(results)}개 결과")
+
+    async def _consume(self, redis_client: Redis, consumer: str) -> None:
+        group_ready = False
+        while True:
+            try:
+                if not group_ready:
+                    await self._ensure_group(redis_client)
+                    group_ready = True
+                message = await self._next_message(redis_client, consumer)
+                if message is None:
+                    continue
+                message_id, fields = message
+                await self._process(redis_client, consumer, message_id, fields["job_id"])
+            except asyncio.CancelledError:
+                raise
+            except redis.ResponseError as e:
+                # 스트림이나 그룹이 삭제된 경우 다시 만듭니다.
+                if "NOGROUP" in str(e):
+                    group_ready = False
+                logger.error(f"분석 작업 워커 오류 ({consumer}): {e}")
+                await asyncio.sleep(1)
+            except Exception as e:
+                logger.error(f"분석 작업 워커 오류 ({consumer}): {e}")
+                await asyncio.sleep(1)
+
+    def start(self, redis_client: Redis) -> None:
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.ensure_future(self._consume(redis_client, f"{self._consumer_prefix}-{i}"))
+            for i in range(self.workers)
+        ]
+        logger.info(f"분석 작업 워커 {self.workers}개 시작")
+
+    async def stop(self) -> None:
+        """워커를 멈춥니다. 처리 중이던 작업은 ACK되지 않아 다른 워커가 이어받습니다."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+analysis_jobs = AnalysisJobQueue(
+    workers=settings.JOB_WORKERS,
+    chunk_size=settings.JOB_CHUNK_SIZE,
+    claim_idle=settings.JOB_CLAIM_IDLE,
+    max_attempts=settings.JOB_MAX_ATTEMPTS,
+    result_ttl=settings.JOB_RESULT_TTL,
+    llm_concurrency=settings.JOB_LLM_CONCURRENCY
+)
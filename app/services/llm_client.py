@@ -0,0 +1,256 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+import openai
+
+from app.core import rate_limit
+from app.core.config import settings
+from app.core.database import get_redis
+from app.core.metrics import LLM_IN_FLIGHT, LLM_REQUESTS, LLM_TOKENS, STAGE_LATENCY, stage
+
+logger = logging.getLogger(__name__)
+
+# 재시도해도 되는 일시적인 오류
+RETRYABLE_ERRORS = (
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
+
+
+class LLMUnavailableError(Exception):
+    """LLM을 일시적으로 사용할 수 없을 때 발생합니다."""
+
+
+class CircuitOpenError(LLMUnavailableError):
+    """서킷 브레이커가 열려 있어 LLM 호출을 차단했을 때 발생합니다."""
+
+
+class TokenBudgetExceededError(LLMUnavailableError):
+    """요청한 클라이언트의 일일 LLM 토큰 예산을 모두 사용했을 때 발생합니다."""
+
+
+class LLMQueueTimeoutError(LLMUnavailableError):
+    """동시 호출 슬롯을 LLM_QUEUE_TIMEOUT 안에 얻지 못했을 때 발생합니다."""
+
+
+def _estimate_tokens(messages: List[Dict[str, str]], completion: str) -> int:
+    """사용량 정보가 없을 때 글자 수로 토큰 수를 대략 추정합니다."""
+    return sum(len(message["content"]) for message in messages) + len(completion)
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 임계치를 넘으면 일정 시간 동안 호출을 차단합니다.
+    차단 시간이 지나면 한 번의 시험 호출(half-open)을 허용하고 결과에 따라 닫거나 다시 엽니다.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_progress = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._trial_in_progress:
+            self._trial_in_progress = True
+            return True
+        return False
+
+    def release_trial(self) -> None:
+        """성공/실패로 판단하지 않은 시험 호출을 반납합니다."""
+        self._trial_in_progress = False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_progress = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._trial_in_progress = False
+        if self._opened_at is not None or self._failures >= self.failure_threshold:
+            if self._opened_at is None:
+                logger.warning(f"LLM 서킷 브레이커 열림: 연속 실패 {self._failures}회")
+            self._opened_at = time.monotonic()
+
+
+class LLMClient:
+    """
+    애플리케이션 전체에서 공유하는 비동기 LLM 클라이언트.
+    keep-alive 커넥션 풀, 타임아웃, 동시 호출 수 제한, 지터 재시도, 서킷 브레이커를 제공합니다.
+    OPENAI_BASE_URL을 지정하면 OpenAI 호환 로컬 서버로 요청합니다.
+    """
+
+    def __init__(self):
+        self._client: Optional[openai.AsyncOpenAI] = None
+        self._semaphore = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+        self.breaker = CircuitBreaker(
+            settings.LLM_BREAKER_FAILURE_THRESHOLD,
+            settings.LLM_BREAKER_RESET_TIMEOUT
+        )
+
+    @property
+    def client(self) -> openai.AsyncOpenAI:
+        if self._client is None:
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.LLM_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.LLM_MAX_CONNECTIONS
+                ),
+                timeout=httpx.Timeout(settings.LLM_TIMEOUT, connect=settings.LLM_CONNECT_TIMEOUT)
+            )
+            self._client = openai.AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                base_url=settings.OPENAI_BASE_URL,
+                http_client=http_client,
+                max_retries=0,
+                timeout=settings.LLM_TIMEOUT
+            )
+        return self._client
+
+    def check_budget(self) -> None:
+        """현재 클라이언트가 일일 LLM 토큰 예산을 다 썼으면 TokenBudgetExceededError를 발생시킵니다."""
+        if rate_limit.budget_exhausted.get():
+            raise TokenBudgetExceededError("일일 LLM 토큰 예산을 모두 사용했습니다.")
+
+    def _backoff(self, attempt: int) -> float:
+        """full jitter 지수 백오프 대기 시간을 반환합니다."""
+        return random.uniform(0, min(settings.LLM_RETRY_MAX_DELAY, settings.LLM_RETRY_BASE_DELAY * 2 ** attempt))
+
+    async def chat(self, messages: List[Dict[str, str]], **params: Any):
+        """ChatCompletion을 요청합니다. 일시적인 오류는 재시도하고, 계속 실패하면 LLMUnavailableError를 발생시킵니다."""
+        params.setdefault("model", settings.OPENAI_MODEL)
+        self.check_budget()
+
+        for attempt in range(settings.LLM_MAX_RETRIES + 1):
+            if not self.breaker.allow():
+                raise CircuitOpenError("LLM 서킷 브레이커가 열려 있습니다.")
+
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), settings.LLM_QUEUE_TIMEOUT)
+            except asyncio.TimeoutError:
+                # 대기열이 가득 찬 것은 업스트림 실패가 아니므로 브레이커에 기록하지 않습니다.
+                self.breaker.release_trial()
+                raise LLMQueueTimeoutError("LLM 동시 호출 한도를 초과했습니다.")
+
+            LLM_IN_FLIGHT.inc()
+            try:
+                with stage("llm_call"):
+                    response = await self.client.chat.completions.create(messages=messages, **params)
+            except RETRYABLE_ERRORS as e:
+                LLM_REQUESTS.labels("retryable_error").inc()
+                self.breaker.record_failure()
+                logger.warning(f"LLM 호출 실패 (시도 {attempt + 1}/{settings.LLM_MAX_RETRIES + 1}): {e}")
+                if attempt == settings.LLM_MAX_RETRIES:
+                    raise LLMUnavailableError(str(e)) from e
+            except (openai.APIError, asyncio.CancelledError):
+                # 요청 자체의 오류(4xx 등)나 취소는 재시도하지 않습니다.
+                LLM_REQUESTS.labels("error").inc()
+                self.breaker.release_trial()
+                raise
+            else:
+                LLM_REQUESTS.labels("success").inc()
+                self.breaker.record_success()
+                break
+            finally:
+                LLM_IN_FLIGHT.dec()
+                self._semaphore.release()
+
+            await asyncio.sleep(self._backoff(attempt))
+
+        if response.usage is not None:
+            tokens = response.usage.total_tokens
+            LLM_TOKENS.labels("prompt").inc(response.usage.prompt_tokens)
+            LLM_TOKENS.labels("completion").inc(response.usage.completion_tokens)
+        else:
+            tokens = _estimate_tokens(messages, response.choices[0].message.content or "")
+            LLM_TOKENS.labels("estimated").inc(tokens)
+        await rate_limit.record_llm_usage(get_redis(), tokens)
+        return response
+
+    async def stream_chat(self, messages: List[Dict[str, str]], **params: Any) -> AsyncIterator[str]:
+        """
+        ChatCompletion을 스트리밍으로 요청하고 생성된 텍스트 조각을 차례로 반환합니다.
+        첫 토큰을 받기 전의 일시적인 오류만 재시도합니다.
+        """
+        params.setdefault("model", settings.OPENAI_MODEL)
+        self.check_budget()
+
+        for attempt in range(settings.LLM_MAX_RETRIES + 1):
+            if not self.breaker.allow():
+                raise CircuitOpenError("LLM 서킷 브레이커가 열려 있습니다.")
+
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), settings.LLM_QUEUE_TIMEOUT)
+            except asyncio.TimeoutError:
+                self.breaker.release_trial()
+                raise LLMQueueTimeoutError("LLM 동시 호출 한도를 초과했습니다.")
+
+            started = False
+            completion = []
+            LLM_IN_FLIGHT.inc()
+            stream_started_at = time.perf_counter()
+            try:
+                stream = await self.client.chat.completions.create(
+                    messages=messages, stream=True, **params
+                )
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        if not started:
+                            started = True
+                            self.breaker.record_success()
+                        completion.append(delta)
+                        yield delta
+                if not started:
+                    self.breaker.record_success()
+                LLM_REQUESTS.labels("success").inc()
+                # 스트리밍 응답에는 사용량 정보가 없으므로 추정치를 차감합니다.
+                tokens = _estimate_tokens(messages, "".join(completion))
+                LLM_TOKENS.labels("estimated").inc(tokens)
+                await rate_limit.record_llm_usage(get_redis(), tokens)
+                return
+            except RETRYABLE_ERRORS as e:
+                LLM_REQUESTS.labels("retryable_error").inc()
+                self.breaker.record_failure()
+                logger.warning(f"LLM 스트리밍 실패 (시도 {attempt + 1}/{settings.LLM_MAX_RETRIES + 1}): {e}")
+                if started or attempt == settings.LLM_MAX_RETRIES:
+                    raise LLMUnavailableError(str(e)) from e
+            except (openai.APIError, asyncio.CancelledError, GeneratorExit):
+                LLM_REQUESTS.labels("error").inc()
+                self.breaker.release_trial()
+                raise
+            finally:
+                LLM_IN_FLIGHT.dec()
+                STAGE_LATENCY.labels("llm_stream").observe(time.perf_counter() - stream_started_at)
+                self._semaphore.release()
+
+            await asyncio.sleep(self._backoff(attempt))
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+llm_client = LLMClient()
@@ -0,0 +1,112 @@
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Set
+
+import redis
+from redis.asyncio import Redis
+
+from app.core.cache import LocalCache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+NEGATIVE_KEY = "jargon:unknown"
+
+
+class NegativeCache:
+    """
+    LLM도 설명하지 못한 단어(이름, 오타, 일반 단어 등)를 짧은 TTL 동안 기억해
+    같은 단어의 DB/LLM 조회를 건너뜁니다.
+    Redis에는 만료 시각을 점수로 하는 sorted set 하나에 저장하고, 프로세스 내 캐시를 앞에 둡니다.
+    """
+
+    def __init__(self, ttl: int, maxsize: int, local_ttl: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._local = LocalCache(settings.LOCAL_CACHE_MAXSIZE, min(local_ttl, ttl))
+
+    async def contains(self, redis_client: Redis, word: str) -> bool:
+        return word in await self.contains_many(redis_client, [word])
+
+    async def contains_many(self, redis_client: Redis, words: List[str]) -> Set[str]:
+        """words 중 정보 없음으로 기록된 단어를 반환합니다."""
+        found = {word for word in words if self._local.get(word)}
+        rest = [word for word in words if word not in found]
+        if not rest:
+            return found
+        try:
+            scores = await redis_client.zmscore(NEGATIVE_KEY, rest)
+        except redis.RedisError as e:
+            logger.warning(f"정보 없음 캐시 조회 실패 ({len(rest)}개): {e}")
+            return found
+
+        now = time.time()
+        for word, expires_at in zip(rest, scores):
+            if expires_at is not None and expires_at > now:
+                self._local.set(word, True)
+                found.add(word)
+        return found
+
+    async def add(self, redis_client: Redis, word: str) -> None:
+        self._local.set(word, True)
+        now = time.time()
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.zadd(NEGATIVE_KEY, {word: now + self.ttl})
+                # 만료된 항목과 최대 크기를 넘는 항목(만료가 가까운 순) 정리
+                pipe.zremrangebyscore(NEGATIVE_KEY, "-inf", now)
+                pipe.zremrangebyrank(NEGATIVE_KEY, 0, -self.maxsize - 1)
+                await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"정보 없음 캐시 저장 실패 ({word}): {e}")
+
+    async def remove(self, redis_client: Redis, words: Iterable[str]) -> int:
+        """단어를 정보 없음 캐시에서 삭제하고, Redis에서 삭제된 개수를 반환합니다."""
+        words = list(words)
+        if not words:
+            return 0
+        self.evict_local(words)
+        try:
+            return await redis_client.zrem(NEGATIVE_KEY, *words)
+        except redis.RedisError as e:
+            logger.warning(f"정보 없음 캐시 삭제 실패 ({len(words)}개): {e}")
+            return 0
+
+    async def clear(self, redis_client: Redis) -> int:
+        """모든 항목을 삭제하고 삭제한 개수를 반환합니다."""
+        self._local.clear()
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.zcard(NEGATIVE_KEY)
+            pipe.delete(NEGATIVE_KEY)
+            count, _ = await pipe.execute()
+        return count
+
+    async def entries(self, redis_client: Redis, limit: int) -> Dict[str, Any]:
+        """만료되지 않은 항목을 만료가 늦은(최근에 기록된) 순서로 반환합니다."""
+        now = time.time()
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.zcount(NEGATIVE_KEY, now, "+inf")
+            pipe.zrevrangebyscore(NEGATIVE_KEY, "+inf", now, start=0, num=limit, withscores=True)
+            total, items = await pipe.execute()
+        return {
+            "total": total,
+            "ttl": self.ttl,
+            "entries": [
+                {"word": word, "expires_in": round(expires_at - now)}
+                for word, expires_at in items
+            ],
+        }
+
+    def evict_local(self, words: Iterable[str]) -> None:
+        for word in words:
+            self._local.delete(word)
+
+    def clear_local(self) -> None:
+        self._local.clear()
+
+
+negative_cache = NegativeCache(
+    ttl=settings.NEGATIVE_CACHE_TTL,
+    maxsize=settings.NEGATIVE_CACHE_MAXSIZE,
+    local_ttl=settings.NEGATIVE_CACHE_LOCAL_TTL
+)
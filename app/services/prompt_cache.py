@@ -0,0 +1,63 @@
+import hashlib
+import json
+import logging
+import unicodedata
+from typing import Iterable, Optional
+
+import redis
+from redis.asyncio import Redis
+
+from app.core.cache import LocalCache
+from app.core.config import settings
+from app.services.ai_service import GENERATION_PARAMS, SYSTEM_PROMPT
+
+logger = logging.getLogger(__name__)
+
+
+class PromptCache:
+    """
+    분석 요청(단어 목록, 컨텍스트, 모델 파라미터)의 해시를 키로 GPT 응답 원문을 저장합니다.
+    프로세스 내 LRU/TTL 캐시와 Redis 두 계층을 사용합니다.
+    """
+
+    def __init__(self, maxsize: int, ttl: int):
+        self.ttl = ttl
+        self._local = LocalCache(maxsize, ttl)
+
+    @staticmethod
+    def key(words: Iterable[str], context: Optional[str]) -> str:
+        """정규화된 단어 집합, 컨텍스트, 모델 설정으로 캐시 키를 만듭니다."""
+        material = {
+            "words": sorted({unicodedata.normalize("NFC", word).strip() for word in words}),
+            "context": unicodedata.normalize("NFC", context or "").strip(),
+            "model": settings.OPENAI_MODEL,
+            "params": GENERATION_PARAMS,
+            "system": SYSTEM_PROMPT,
+        }
+        digest = hashlib.sha256(
+            json.dumps(material, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        return f"llm:prompt:{digest}"
+
+    async def get(self, redis_client: Redis, key: str) -> Optional[str]:
+        completion = self._local.get(key)
+        if completion is not None:
+            return completion
+        try:
+            completion = await redis_client.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"프롬프트 캐시 조회 실패: {e}")
+            return None
+        if completion is not None:
+            self._local.set(key, completion)
+        return completion
+
+    async def set(self, redis_client: Redis, key: str, completion: str) -> None:
+        self._local.set(key, completion)
+        try:
+            await redis_client.setex(key, self.ttl, completion)
+        except redis.RedisError as e:
+            logger.warning(f"프롬프트 캐시 저장 실패: {e}")
+
+
+prompt_cache = PromptCache(settings.PROMPT_CACHE_MAXSIZE, settings.PROMPT_CACHE_TTL)
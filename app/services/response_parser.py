@@ -0,0 +1,149 @@
+import logging
+import re
+import unicodedata
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 필드 이름과 모델이 자주 바꿔 쓰는 표현
+_FIELD_ALIASES = {
+    "word": ("단어", "단어명", "용어", "신조어", "word", "term"),
+    "explanation": ("의미", "뜻", "설명", "meaning", "explanation", "definition"),
+    "source": ("출처", "유래", "어원", "source", "origin"),
+}
+_FIELD_BY_ALIAS = {
+    alias.lower(): field
+    for field, aliases in _FIELD_ALIASES.items()
+    for alias in aliases
+}
+
+_FIELD_LINE = re.compile(
+    r"^(?P<key>[^:：]{1,12}?)\s*[:：]\s*(?P<value>.*)$"
+)
+_DELIMITER_LINE = re.compile(r"^[-=_*─]{3,}$")
+# 줄 앞의 목록 기호, 번호, 인용 표시
+_LINE_PREFIX = re.compile(r"^(?:[-*•>#]+\s*|\d+[.)]\s*)+")
+_WORD_DECORATION = re.compile(r"[\[\]\"'`「」『』“”‘’<>]")
+# "갓생이란", "갓생이라는"처럼 단어 이름 뒤에 붙는 인용 조사
+_QUOTING_PARTICLE = re.compile(r"(?:이란|란|이라는|라는|이라고|라고)$")
+# "'갓생'은"처럼 따옴표나 괄호로 감싼 단어 뒤에 붙는 조사.
+# 감싸지 않은 이름의 마지막 글자("손절가"의 "가")는 단어의 일부로 봅니다.
+_QUOTED_PARTICLE = re.compile(r"[\]\"'`」』”’>]\s*(?:은|는|이|가|을|를|의|도)\s*$")
+
+
+def match_key(word: str) -> str:
+    """모델이 돌려준 단어 이름과 요청한 단어를 비교하기 위한 키를 만듭니다."""
+    word = unicodedata.normalize("NFC", word)
+    word = _WORD_DECORATION.sub("", word)
+    # "갓생 (God生)"처럼 뒤에 붙은 설명은 제외
+    word = re.sub(r"\s*\(.*\)\s*$", "", word)
+    return re.sub(r"\s+", "", word).lower()
+
+
+class JargonResponseParser:
+    """
+    '단어/의미/출처' 형식의 LLM 응답을 조각 단위로 파싱합니다.
+    - 스트리밍 응답을 feed()로 받은 순서대로 처리하고, 완성된 블록을 바로 반환합니다.
+    - 마크다운 장식, 필드 이름 변형, 전각 콜론, 구분자 누락, 여러 줄 설명을 허용합니다.
+    - 블록의 단어 이름을 요청한 단어 목록에 맞추고, 결과가 없는 단어는 missing으로 알려줍니다.
+    """
+
+    def __init__(self, words: List[str]):
+        self.words = list(dict.fromkeys(words))
+        self._requested = {match_key(word): word for word in self.words}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._buffer = ""
+        self._block: Dict[str, str] = {}
+        self._last_field: Optional[str] = None
+
+    @property
+    def results(self) -> List[Dict[str, Any]]:
+        return list(self._results.values())
+
+    @property
+    def missing(self) -> List[str]:
+        return [word for word in self.words if word not in self._results]
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """응답 조각을 추가하고 새로 완성된 단어 결과를 반환합니다."""
+        self._buffer += chunk
+        *lines, self._buffer = self._buffer.split("\n")
+        completed = []
+        for line in lines:
+            completed.extend(self._feed_line(line))
+        return completed
+
+    def close(self) -> List[Dict[str, Any]]:
+        """남은 내용을 처리하고 마지막 블록을 완성합니다."""
+        completed = self._feed_line(self._buffer)
+        self._buffer = ""
+        completed.extend(self._finish_block())
+        return completed
+
+    def _feed_line(self, line: str) -> List[Dict[str, Any]]:
+        line = line.replace("**", "").replace("__", "").strip()
+        if not line:
+            return []
+        if _DELIMITER_LINE.match(line):
+            return self._finish_block()
+
+        line = _LINE_PREFIX.sub("", line).strip()
+        completed = []
+        field_match = _FIELD_LINE.match(line)
+        field = _FIELD_BY_ALIAS.get(field_match.group("key").strip().lower()) if field_match else None
+
+        if field is None:
+            # 필드 이름이 없는 줄은 직전 필드(주로 여러 줄 설명)의 이어지는 내용으로 봅니다.
+            if self._last_field in ("explanation", "source"):
+                self._block[self._last_field] += " " + line
+            return completed
+
+        value = field_match.group("value").strip()
+        # 구분자 없이 다음 단어가 시작되면 이전 블록을 마칩니다.
+        if field == "word" and self._block.get("word"):
+            completed.extend(self._finish_block())
+        if field in self._block and field != "word":
+            self._block[field] += " " + value
+        else:
+            self._block[field] = value
+        self._last_field = field
+        return completed
+
+    def _finish_block(self) -> List[Dict[str, Any]]:
+        block, self._block = self._block, {}
+        self._last_field = None
+        if not block.get("word") or not block.get("explanation"):
+            if block:
+                logger.debug(f"불완전한 응답 블록 무시: {block}")
+            return []
+
+        word = self._match_requested(block["word"])
+        if word is None:
+            logger.debug(f"요청하지 않은 단어의 응답 블록 무시: {block['word']}")
+            return []
+        if word in self._results:
+            return []
+
+        result = {
+            "word": word,
+            "explanation": block["explanation"].strip(),
+            "source": block.get("source", "").strip() or "알 수 없음"
+        }
+        self._results[word] = result
+        return [result]
+
+    def _match_requested(self, name: str) -> Optional[str]:
+        key = match_key(name)
+        if key in self._requested:
+            return self._requested[key]
+
+        # 정확히 일치하지 않을 때만, 장식을 뺀 이름 뒤에 조사만 붙은 경우를 같은 단어로 봅니다.
+        # "갓생살기", "손절가"처럼 다른 단어일 수 있는 이름이나 한 글자만 남는 이름("가가")은
+        # 맞추지 않고 missing으로 남겨 다시 요청합니다.
+        if _QUOTED_PARTICLE.search(unicodedata.normalize("NFC", name)):
+            stripped = key[:-1]
+        else:
+            stripped = _QUOTING_PARTICLE.sub("", key)
+        if stripped != key and len(stripped) >= 2 and stripped in self._requested:
+            return self._requested[stripped]
+        return None
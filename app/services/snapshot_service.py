@@ -0,0 +1,189 @@
+import asyncio
+import gzip
+import logging
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import orjson
+import redis
+from redis.asyncio import Redis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.jargon import Jargon
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "jargon:dict:version"
+CHANGES_KEY = "jargon:dict:changes"
+
+# 버전 증가, 변경 단어 기록, 오래된 변경 이력 정리를 한 번에 처리합니다.
+_RECORD_CHANGES_SCRIPT = """
+local version = redis.call("incr", KEYS[1])
+for i = 2, #ARGV do
+    redis.call("zadd", KEYS[2], version, ARGV[i])
+end
+redis.call("zremrangebyrank", KEYS[2], 0, -tonumber(ARGV[1]) - 1)
+return version
+"""
+
+
+def _encode(version: int, entries: Dict[str, list]) -> bytes:
+    """스냅샷 본문을 직렬화하고 압축합니다. 항목 수에 비례해 오래 걸리므로 스레드에서 실행합니다."""
+    return gzip.compress(orjson.dumps({"version": version, "entries": entries}))
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더(쉼표로 구분된 목록, *, W/ 약한 태그)가 etag와 일치하는지 확인합니다."""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        # If-None-Match는 약한 비교를 사용하므로 W/ 접두어를 무시합니다.
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Accept-Encoding 헤더가 gzip을 허용하는지 확인합니다. (q=0은 거부로 봅니다)"""
+    if not accept_encoding:
+        return False
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.lower()] = quality
+    if "gzip" in qualities:
+        return qualities["gzip"] > 0
+    return qualities.get("*", 0.0) > 0
+
+
+class DictionarySnapshot:
+    """
+    Jargon 테이블 전체를 gzip으로 압축한 버전별 스냅샷을 관리합니다.
+    버전과 변경 이력은 Redis에 두어 모든 워커가 같은 버전을 공유하고,
+    압축된 본문은 백그라운드에서 만들어 요청마다 다시 만들지 않습니다.
+    쓰기가 잦아도 rebuild_interval에 한 번만 다시 만들고, 그 사이에는 이전 버전을 반환합니다.
+    (클라이언트는 이전 버전 이후의 변경을 delta로 받습니다)
+    """
+
+    def __init__(self, rebuild_interval: float):
+        self.rebuild_interval = rebuild_interval
+        self._version: Optional[int] = None
+        self._body: Optional[bytes] = None
+        self._built_at = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def etag(version: int, since: Optional[int] = None) -> str:
+        return f'"{version}"' if since is None else f'"{since}-{version}"'
+
+    async def current_version(self, redis_client: Redis) -> int:
+        try:
+            return int(await redis_client.get(VERSION_KEY) or 0)
+        except redis.RedisError as e:
+            logger.warning(f"사전 버전 조회 실패: {e}")
+            return self._version or 0
+
+    async def record_changes(self, redis_client: Redis, words: Iterable[str]) -> None:
+        """변경된 단어를 기록해 버전을 올리고, 백그라운드에서 스냅샷을 다시 만듭니다."""
+        words = list(dict.fromkeys(words))
+        if not words:
+            return
+        try:
+            await redis_client.eval(
+                _RECORD_CHANGES_SCRIPT, 2, VERSION_KEY, CHANGES_KEY,
+                settings.SNAPSHOT_CHANGELOG_SIZE, *words
+            )
+        except redis.RedisError as e:
+            logger.warning(f"사전 변경 이력 기록 실패: {e}")
+            return
+        self._schedule_rebuild(redis_client)
+
+    def _schedule_rebuild(self, redis_client: Redis) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._rebuild_later(redis_client))
+
+    async def _rebuild_later(self, redis_client: Redis) -> None:
+        # 마지막으로 만든 뒤 rebuild_interval이 지날 때까지 기다려 그 사이의 변경을 한 번에 반영합니다.
+        await asyncio.sleep(max(self._built_at + self.rebuild_interval - time.monotonic(), 0))
+        try:
+            await self._rebuild(redis_client)
+        except Exception as e:
+            logger.error(f"사전 스냅샷 생성 실패: {e}")
+
+    async def get(self, redis_client: Redis) -> Tuple[int, bytes]:
+        """
+        압축된 스냅샷을 반환합니다.
+        버전이 바뀌었으면 다시 만들도록 예약하고, 만들어질 때까지는 이전 버전을 반환합니다.
+        """
+        if self._body is None:
+            return await self._rebuild(redis_client)
+        if await self.current_version(redis_client) != self._version:
+            self._schedule_rebuild(redis_client)
+        return self._version, self._body
+
+    async def _rebuild(self, redis_client: Redis) -> Tuple[int, bytes]:
+        async with self._lock:
+            version = await self.current_version(redis_client)
+            if self._version != version or self._body is None:
+                # 버전을 먼저 읽고 DB를 읽으므로, 그 사이의 변경은 다음 delta에 다시 포함됩니다.
+                async with AsyncSessionLocal() as db:
+                    entries = await self._load_entries(db)
+                self._body = await asyncio.to_thread(_encode, version, entries)
+                self._version = version
+                self._built_at = time.monotonic()
+                logger.info(f"사전 스냅샷 생성 완료: 버전 {version}, {len(entries)}개, {len(self._body)} bytes")
+            return self._version, self._body
+
+    async def _load_entries(self, db: AsyncSession, words: Optional[list] = None) -> Dict[str, list]:
+        """스냅샷에 담을 최소 필드만 ORM 객체 없이 컬럼으로 읽습니다."""
+        stmt = (
+            select(Jargon.word, Jargon.explanation, Jargon.source)
+            .execution_options(yield_per=1000)
+        )
+        if words is not None:
+            stmt = stmt.where(Jargon.word.in_(words))
+        result = await db.stream(stmt)
+        return {word: [explanation, source] async for word, explanation, source in result}
+
+    async def delta(self, redis_client: Redis, db: AsyncSession, since: int) -> Optional[Dict[str, Any]]:
+        """
+        since 버전 이후 변경된 항목만 반환합니다.
+        변경 이력이 since까지 남아 있지 않으면 None을 반환합니다. (전체 스냅샷을 다시 받아야 함)
+        """
+        version = await self.current_version(redis_client)
+        if since == version:
+            return {"version": version, "since": since, "full": False, "entries": {}}
+
+        oldest = await redis_client.zrange(CHANGES_KEY, 0, 0, withscores=True)
+        # since 이하 버전의 이력이 하나라도 남아 있어야 그 이후 변경이 모두 남아 있다고 볼 수 있습니다.
+        covered = since < version and bool(oldest) and oldest[0][1] <= since
+        if not covered:
+            return None
+
+        words = await redis_client.zrangebyscore(CHANGES_KEY, f"({since}", version)
+        return {
+            "version": version,
+            "since": since,
+            "full": False,
+            "entries": await self._load_entries(db, words) if words else {}
+        }
+
+
+dictionary_snapshot = DictionarySnapshot(settings.SNAPSHOT_REBUILD_INTERVAL)
@@ -0,0 +1,61 @@
+import asyncio
+import logging
+from typing import Optional
+
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.jargon import Jargon
+from app.services import jargon_service
+
+logger = logging.getLogger(__name__)
+
+
+class CacheWarmer:
+    """
+    시작 시 가장 많이 조회된 신조어를 Redis와 프로세스 내 캐시에 미리 적재합니다.
+    적재가 끝나기 전까지 ready는 False이며 /health가 503을 반환합니다.
+    """
+
+    def __init__(self, top_k: int):
+        self.top_k = top_k
+        self.ready = False
+        self.loaded = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def warm_up(self) -> int:
+        """상위 top_k개 신조어를 한 번의 쿼리로 읽어 파이프라인으로 캐시에 기록합니다."""
+        async with AsyncSessionLocal() as db:
+            result = await db.scalars(
+                select(Jargon)
+                .order_by(
+                    Jargon.search_count.desc(),
+                    func.coalesce(Jargon.updated_at, Jargon.created_at).desc()
+                )
+                .limit(self.top_k)
+            )
+            jargons = list(result)
+
+        await jargon_service.cache_jargons(jargons)
+        return len(jargons)
+
+    async def _run(self) -> None:
+        try:
+            self.loaded = await self.warm_up()
+            logger.info(f"캐시 워밍업 완료: {self.loaded}개 신조어 적재")
+        except Exception as e:
+            # 워밍업 실패로 서비스 전체가 막히지 않도록 준비 완료로 전환합니다.
+            logger.error(f"캐시 워밍업 실패: {e}")
+        finally:
+            self.ready = True
+
+    def start(self) -> None:
+        if self.top_k <= 0:
+            self.ready = True
+            return
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+
+cache_warmer = CacheWarmer(settings.WARMUP_TOP_K)
@@ -0,0 +1,84 @@
+"""
+벤치마크용 OpenAI 호환 가짜 LLM 서버
+
+요청 프롬프트의 '- 단어' 목록을 읽어 '단어/의미/출처' 형식으로 응답합니다.
+응답 지연 시간과 호출 횟수는 /state로 조회/변경할 수 있습니다.
+"""
+
+import asyncio
+import json
+import random
+import re
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+app = FastAPI(title="Fake LLM")
+
+# latency: 평균 응답 지연 (초), jitter: 지연 시간의 최대 변동 비율
+state = {"calls": 0, "words": 0, "latency": 0.5, "jitter": 0.2}
+
+_WORD_LINE = re.compile(r"^- (.+)$", re.M)
+
+
+def _render(words):
+    return "".join(
+        f"단어: {word}\n의미: {word}의 벤치마크용 설명입니다.\n출처: 벤치마크\n---\n"
+        for word in words
+    )
+
+
+def _latency() -> float:
+    jitter = state["latency"] * state["jitter"]
+    return max(0.0, state["latency"] + random.uniform(-jitter, jitter))
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    words = _WORD_LINE.findall(body["messages"][-1]["content"])
+    state["calls"] += 1
+    state["words"] += len(words)
+    text = _render(words)
+
+    if body.get("stream"):
+        async def events():
+            chunks = [text[i:i + 8] for i in range(0, len(text), 8)]
+            delay = _latency() / max(len(chunks), 1)
+            for chunk in chunks:
+                await asyncio.sleep(delay)
+                data = {
+                    "id": "bench", "object": "chat.completion.chunk", "created": int(time.time()),
+                    "model": body["model"],
+                    "choices": [{"index": 0, "delta": {"content": chunk}, "finish_reason": None}]
+                }
+                yield f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+            yield "data: [DONE]\n\n"
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    await asyncio.sleep(_latency())
+    prompt_tokens = len(body["messages"][-1]["content"])
+    return {
+        "id": "bench",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body["model"],
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": len(text),
+            "total_tokens": prompt_tokens + len(text)
+        }
+    }
+
+
+@app.get("/state")
+async def get_state():
+    return state
+
+
+@app.post("/state")
+async def update_state(request: Request):
+    state.update(await request.json())
+    return state